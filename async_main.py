@@ -6,14 +6,16 @@
 import sys
 import argparse
 import asyncio
-import signal
 from pathlib import Path
 
 # Добавление src в Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / "src"))
 
-from dsei_scraper import AsyncDSEICompanyScraper, Config
+from dsei_scraper import AsyncDSEICompanyScraper, Config, use_uvloop
+
+# Код выхода при остановке по Ctrl+C / SIGTERM (128 + SIGINT, как у оболочки)
+EXIT_INTERRUPTED = 130
 
 
 async def main():
@@ -28,7 +30,17 @@ async def main():
     parser.add_argument('--output', type=str, default=None,
                        help='Путь к выходному CSV файлу')
     parser.add_argument('--max-tasks', type=int, default=15,
-                       help='Максимальное количество одновременных задач (по умолчанию: 15)')
+                       help='Максимальное количество одновременных задач и соединений с хостом (по умолчанию: 15)')
+    parser.add_argument('--transport', choices=['aiohttp', 'httpx'], default=None,
+                       help='HTTP транспорт: aiohttp или httpx с HTTP/2 (по умолчанию: из конфигурации)')
+    parser.add_argument('--rps', type=float, default=None,
+                       help='Максимальное количество запросов в секунду, 0 - без ограничения (по умолчанию: из конфигурации)')
+    parser.add_argument('--burst', type=int, default=None,
+                       help='Максимальный всплеск запросов сверх --rps (по умолчанию: из конфигурации)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Не использовать дисковый HTTP кэш')
+    parser.add_argument('--keep-in-memory', action='store_true',
+                       help='Хранить все собранные компании в памяти (для отладки)')
     
     args = parser.parse_args()
     
@@ -38,41 +50,43 @@ async def main():
     else:
         config = Config()
     
-    # Инициализация асинхронного скрапера
-    scraper = AsyncDSEICompanyScraper(config, max_concurrent_tasks=args.max_tasks)
-    
-    # Настройка обработчиков сигналов для корректного завершения
-    def signal_handler(signum, frame):
-        print(f"\n🛑 Получен сигнал {signum}. Корректное завершение...")
-        scraper.should_stop = True
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
-    # Запуск скрапера
-    try:
-        await scraper.scrape_all_companies(
-            start_page=args.start_page,
-            max_pages=args.max_pages
-        )
-        
-        # Сохранение с пользовательским выходным файлом если указан
-        if args.output:
-            await scraper.save_to_csv(args.output)
+    # Инициализация асинхронного скрапера с общей HTTP сессией на весь запуск
+    async with AsyncDSEICompanyScraper(config, max_concurrent_tasks=args.max_tasks,
+                                       transport=args.transport, output_file=args.output,
+                                       keep_in_memory=args.keep_in_memory,
+                                       requests_per_second=args.rps, burst=args.burst,
+                                       use_cache=not args.no_cache) as scraper:
         
-        print(f"🎉 Скрапинг завершен успешно! Собрано {len(scraper.companies_data)} компаний.")
-        return 0
+        # Настройка обработчиков сигналов в цикле событий для корректного завершения
+        scraper.install_signal_handlers()
         
-    except KeyboardInterrupt:
-        print("⏹️ Скрапинг прерван пользователем")
-        return 1
-    except Exception as e:
-        print(f"💥 Ошибка: {e}")
-        return 1
+        # Запуск скрапера
+        try:
+            await scraper.scrape_all_companies(
+                start_page=args.start_page,
+                max_pages=args.max_pages
+            )
+            
+            if scraper.should_stop:
+                # Прерванный запуск отличается от полного кодом выхода
+                print(f"⏹️ Скрапинг прерван сигналом остановки. Собрано {scraper.companies_count} компаний.")
+                return EXIT_INTERRUPTED
+            
+            print(f"🎉 Скрапинг завершен успешно! Собрано {scraper.companies_count} компаний.")
+            return 0
+            
+        except KeyboardInterrupt:
+            print("⏹️ Скрапинг прерван пользователем")
+            return EXIT_INTERRUPTED
+        except Exception as e:
+            print(f"💥 Ошибка: {e}")
+            return 1
 
 
 def run():
     """Синхронная обертка для запуска асинхронного main"""
+    # uvloop (если установлен) быстрее стандартного цикла событий на HTTP нагрузке
+    use_uvloop()
     return asyncio.run(main())
 
 
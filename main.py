@@ -25,6 +25,16 @@ def main():
                        help='Path to configuration file')
     parser.add_argument('--output', type=str, default=None,
                        help='Output CSV file path')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not use the on-disk HTTP cache')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Company pages fetched in parallel per list page (default: from config, 1)')
+    parser.add_argument('--rps', type=float, default=None,
+                       help='Maximum requests per second, 0 for no limit (default: from config)')
+    parser.add_argument('--burst', type=int, default=None,
+                       help='Maximum burst of requests above --rps (default: number of workers)')
+    parser.add_argument('--transport', choices=['requests', 'httpx'], default=None,
+                       help='HTTP client: requests or httpx with HTTP/2 (default: requests)')
     
     args = parser.parse_args()
     
@@ -35,7 +45,9 @@ def main():
         config = Config()
     
     # Initialize scraper
-    scraper = DSEICompanyScraper(config)
+    scraper = DSEICompanyScraper(config, use_cache=not args.no_cache, detail_workers=args.workers,
+                                 output_file=args.output, requests_per_second=args.rps, burst=args.burst,
+                                 transport=args.transport)
     
     # Run scraper
     try:
@@ -44,23 +56,16 @@ def main():
             max_pages=args.max_pages
         )
         
-        # Save with custom output file if specified
-        if args.output:
-            scraper.save_to_csv(args.output)
-        
         print(f"\n✅ Scraping completed successfully!")
-        print(f"📊 Total companies collected: {len(scraper.companies_data)}")
+        print(f"📊 Total companies collected: {scraper.companies_count}")
         
     except KeyboardInterrupt:
         print("\n⏹️ Scraping interrupted by user")
         
-        # Save partial results
-        if scraper.companies_data:
-            print(f"💾 Saving {len(scraper.companies_data)} companies collected so far...")
-            if args.output:
-                scraper.save_to_csv(args.output)
-            else:
-                scraper.save_to_csv()
+        # Save partial results: append the rows of the interrupted page to the output file
+        if scraper.companies_count:
+            print(f"💾 Saving {scraper.companies_count} companies collected so far...")
+            scraper.save_to_csv()
         
         sys.exit(1)
     
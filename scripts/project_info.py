@@ -49,7 +49,7 @@ def print_project_summary():
    ✅ Comprehensive error handling
    ✅ Detailed logging
    ✅ Session management with proper headers
-   ✅ BeautifulSoup HTML parsing
+   ✅ selectolax (lexbor) HTML parsing
    ✅ CSV output formatting
 
 🌐 URL PATTERNS:
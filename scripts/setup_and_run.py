@@ -22,12 +22,7 @@ def run_verification():
     """Run the verification script"""
     print("\n🔍 Running verification tests...")
     try:
-        result = subprocess.run([sys.executable, "verify_scraper.py"], 
-                              capture_output=True, text=True, timeout=60)
-        
-        print(result.stdout)
-        if result.stderr:
-            print("Warnings/Errors:", result.stderr)
+        result = subprocess.run([sys.executable, "verify_scraper.py"], check=False, timeout=60)
         
         return result.returncode == 0
     except subprocess.TimeoutExpired:
@@ -41,12 +36,7 @@ def run_test():
     """Run a quick test"""
     print("\n🧪 Running quick test (1 page)...")
     try:
-        result = subprocess.run([sys.executable, "test_scraper.py"], 
-                              capture_output=True, text=True, timeout=120)
-        
-        print(result.stdout)
-        if result.stderr:
-            print("Warnings/Errors:", result.stderr)
+        result = subprocess.run([sys.executable, "test_scraper.py"], check=False, timeout=120)
         
         return result.returncode == 0
     except subprocess.TimeoutExpired:
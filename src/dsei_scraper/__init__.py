@@ -3,12 +3,30 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-# Import main classes after ensuring modules exist
-try:
-    from .scraper import DSEICompanyScraper
-    from .async_scraper import AsyncDSEICompanyScraper, run_async_scraper
-    from .config import Config
-    __all__ = ['DSEICompanyScraper', 'AsyncDSEICompanyScraper', 'run_async_scraper', 'Config']
-except ImportError:
-    # Fallback for development
-    __all__ = []
+from importlib import import_module
+
+# Public names and the submodules that define them. Submodules are imported on
+# first access, so importing dsei_scraper.cli for --help does not load aiohttp or
+# requests; a missing dependency still raises ImportError there, before any scraping
+_EXPORTS = {
+    'DSEICompanyScraper': '.scraper',
+    'AsyncDSEICompanyScraper': '.async_scraper',
+    'run_async_scraper': '.async_scraper',
+    'use_uvloop': '.async_scraper',
+    'Config': '.config',
+    'Company': '.models',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
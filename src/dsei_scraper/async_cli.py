@@ -12,7 +12,10 @@ import sys
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-from dsei_scraper import AsyncDSEICompanyScraper, Config
+from dsei_scraper import AsyncDSEICompanyScraper, Config, use_uvloop
+
+# Код выхода при остановке по Ctrl+C / SIGTERM (128 + SIGINT, как у оболочки)
+EXIT_INTERRUPTED = 130
 
 
 @click.command()
@@ -20,42 +23,62 @@ from dsei_scraper import AsyncDSEICompanyScraper, Config
 @click.option('--max-pages', default=None, type=int, help='Максимальное количество страниц для обработки')
 @click.option('--config', default=None, help='Путь к файлу конфигурации')
 @click.option('--output', default=None, help='Путь к выходному CSV файлу')
-@click.option('--max-tasks', default=15, help='Максимальное количество одновременных задач')
+@click.option('--max-tasks', default=15, help='Максимальное количество одновременных задач и соединений с хостом')
+@click.option('--transport', type=click.Choice(['aiohttp', 'httpx']), default=None,
+              help='HTTP транспорт: aiohttp или httpx с HTTP/2 (по умолчанию: из конфигурации)')
+@click.option('--rps', default=None, type=float,
+              help='Максимальное количество запросов в секунду, 0 - без ограничения (по умолчанию: из конфигурации)')
+@click.option('--burst', default=None, type=int,
+              help='Максимальный всплеск запросов сверх --rps (по умолчанию: из конфигурации)')
+@click.option('--no-cache', is_flag=True, help='Не использовать дисковый HTTP кэш')
+@click.option('--keep-in-memory', is_flag=True, help='Хранить все собранные компании в памяти (для отладки)')
 @click.option('--verbose', '-v', is_flag=True, help='Подробный вывод')
-def async_scrape(start_page, max_pages, config, output, max_tasks, verbose):
+def async_scrape(start_page, max_pages, config, output, max_tasks, transport, rps, burst, no_cache, keep_in_memory, verbose):
     """Асинхронный скрапер компаний DSEI с ограничением до 15 одновременных задач."""
     
-    async def run_scraper():
+    async def run_scraper() -> int:
         # Инициализация конфигурации
         if config:
             cfg = Config(config)
         else:
             cfg = Config()
         
-        # Инициализация асинхронного скрапера
-        scraper = AsyncDSEICompanyScraper(cfg, max_concurrent_tasks=max_tasks)
-        
-        # Запуск скрапера
-        try:
-            await scraper.scrape_all_companies(
-                start_page=start_page,
-                max_pages=max_pages
-            )
-            
-            # Сохранение с пользовательским выходным файлом если указан
-            if output:
-                await scraper.save_to_csv(output)
+        # Инициализация асинхронного скрапера с общей HTTP сессией на весь запуск
+        async with AsyncDSEICompanyScraper(cfg, max_concurrent_tasks=max_tasks, transport=transport,
+                                           output_file=output, keep_in_memory=keep_in_memory,
+                                           requests_per_second=rps, burst=burst,
+                                           use_cache=not no_cache) as scraper:
             
-            click.echo(f"🎉 Скрапинг завершен успешно! Собрано {len(scraper.companies_data)} компаний.")
+            # Настройка обработчиков сигналов в цикле событий для корректного завершения
+            scraper.install_signal_handlers()
             
-        except KeyboardInterrupt:
-            click.echo("⏹️ Скрапинг прерван пользователем")
-        except Exception as e:
-            click.echo(f"💥 Ошибка: {e}")
-            raise
+            # Запуск скрапера
+            try:
+                await scraper.scrape_all_companies(
+                    start_page=start_page,
+                    max_pages=max_pages
+                )
+                
+                if scraper.should_stop:
+                    # Прерванный запуск отличается от полного кодом выхода
+                    click.echo(f"⏹️ Скрапинг прерван сигналом остановки. Собрано {scraper.companies_count} компаний.")
+                    return EXIT_INTERRUPTED
+                
+                click.echo(f"🎉 Скрапинг завершен успешно! Собрано {scraper.companies_count} компаний.")
+                return 0
+                
+            except KeyboardInterrupt:
+                click.echo("⏹️ Скрапинг прерван пользователем")
+                return EXIT_INTERRUPTED
+            except Exception as e:
+                click.echo(f"💥 Ошибка: {e}")
+                raise
     
-    # Запуск асинхронной функции
-    asyncio.run(run_scraper())
+    # Запуск асинхронной функции (на uvloop, если он установлен)
+    use_uvloop()
+    exit_code = asyncio.run(run_scraper())
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == '__main__':
@@ -14,30 +14,211 @@
 
 import asyncio
 import aiohttp
-import aiofiles
+from aiohttp import compression_utils
 import csv
-import re
 import logging
+import os
+import queue
 import signal
-from bs4 import BeautifulSoup, Tag
-from urllib.parse import urljoin, quote
-from typing import List, Dict, Optional, Set
-import json
+import sys
+from importlib.util import find_spec
+from logging.handlers import QueueHandler, QueueListener
+from urllib.parse import quote
+from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
 
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    from aiohttp_client_cache import CachedSession, SQLiteBackend
+except ImportError:  # aiohttp-client-cache не установлен - HTTP кэш отключен
+    CachedSession = None  # type: ignore[assignment,misc]
+
+try:
+    import httpx
+except ImportError:  # httpx не установлен - доступен только транспорт aiohttp
+    httpx = None  # type: ignore[assignment]
+
 from .config import Config
+from .models import Company, CSV_FIELDNAMES
+from .parsing import clean_stand, collapse_line_breaks, extract_slug, find_website
+from .throttling import AsyncTokenBucket, backoff_delay, parse_retry_after
+
+
+# CSS селекторы страницы списка (разметка сайта, не настраиваются)
+LIST_ITEM_SELECTOR = 'li.m-exhibitors-list__items__item'
+LIST_LINK_SELECTOR = 'a.js-librarylink-entry'
+LIST_STAND_SELECTOR = 'div.m-exhibitors-list__items__item__header__meta__stand'
+# CSS селекторы страницы компании по умолчанию (переопределяются секцией selectors конфигурации)
+# Контейнер карточки компании: остальные селекторы страницы компании ищутся внутри него
+DEFAULT_ENTRY_SELECTOR = 'div.m-exhibitor-entry__item'
+DEFAULT_TITLE_SELECTOR = 'h1.m-exhibitor-entry__item__header__title'
+DEFAULT_CATEGORIES_SELECTOR = 'li.m-exhibitor-entry__item__header__categories__item'
+DEFAULT_DESCRIPTION_SELECTOR = 'div.m-exhibitor-entry__item__body__description'
+
+# Количество строк, накапливаемых в буфере перед записью в файл
+CSV_BATCH_SIZE = 1000
+# Потоковая запись во время скрапинга: размер очереди, размер пакета и максимальная задержка сброса (сек)
+CSV_QUEUE_SIZE = 2000
+CSV_STREAM_BATCH_SIZE = 500
+CSV_FLUSH_INTERVAL = 5
+# Итоговая строка лога INFO выводится раз в столько обработанных компаний (каждая - на уровне DEBUG)
+LOG_PROGRESS_EVERY = 100
+# Количество списочных страниц, загружаемых одновременно
+LIST_PAGE_WINDOW = 5
+# Размер очереди компаний между производителем (страницы списка) и потребителями (страницы компаний)
+# на одного потребителя: заполненная очередь притормаживает производителя
+JOB_QUEUE_PER_WORKER = 4
+
+# HTTP транспорты: aiohttp (HTTP/1.1, по умолчанию) или httpx (HTTP/2)
+TRANSPORTS = ('aiohttp', 'httpx')
+# Коды ответа, которыми сайт сигнализирует о защите от частых запросов
+PROTECTION_STATUSES = (405, 429)
+# Сетевые ошибки, после которых запрос повторяется
+RETRYABLE_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError) + ((httpx.HTTPError,) if httpx else ())
+
+# asyncio.TaskGroup доступен начиная с Python 3.11, на более старых версиях используется gather
+HAS_TASK_GROUP = sys.version_info >= (3, 11)
+
+
+class _StopRequested(Exception):
+    """Сигнал остановки, отменяющий задачи группы TaskGroup"""
+
+
+def _accept_encoding(transport: str) -> str:
+    """
+    Значение Accept-Encoding только со сжатиями, которые выбранный транспорт умеет распаковать
+    
+    br и zstd требуют дополнительных пакетов (aiohttp[speedups], brotli, zstandard); без них
+    ответ сервера в этих кодировках не удалось бы прочитать.
+    """
+    if transport == 'httpx':
+        has_brotli = find_spec('brotli') is not None or find_spec('brotlicffi') is not None
+        has_zstd = find_spec('zstandard') is not None
+    else:
+        has_brotli = getattr(compression_utils, 'HAS_BROTLI', False)
+        has_zstd = getattr(compression_utils, 'HAS_ZSTD', False)
+    
+    encodings = ['gzip', 'deflate']
+    if has_brotli:
+        encodings.append('br')
+    if has_zstd:
+        encodings.append('zstd')
+    return ', '.join(encodings)
+
+
+def _write_rows(writer, companies: List[Company], write_header: bool):
+    """Запись заголовка и строк (Company - уже строка CSV) пакетами по CSV_BATCH_SIZE"""
+    if write_header:
+        writer.writerow(CSV_FIELDNAMES)
+    
+    for start in range(0, len(companies), CSV_BATCH_SIZE):
+        writer.writerows(companies[start:start + CSV_BATCH_SIZE])
+
+
+def _write_csv_sync(file_path: Path, companies: List[Company], write_header: bool):
+    """
+    Синхронная запись строк в CSV файл (выполняется в отдельном потоке)
+    
+    Args:
+        file_path: Путь к выходному файлу
+        companies: Строки для записи
+        write_header: Записывать ли заголовок (файл новый/пустой)
+    """
+    mode = 'w' if write_header else 'a'
+    
+    with open(file_path, mode, encoding='utf-8', newline='', buffering=1 << 20) as csvfile:
+        _write_rows(csv.writer(csvfile), companies, write_header)
+
+
+def _append_rows_sync(csvfile, writer, companies: List[Company], write_header: bool) -> int:
+    """
+    Дописывание строк в уже открытый CSV файл со сбросом буфера на диск (выполняется в отдельном потоке)
+    
+    Args:
+        csvfile: Открытый выходной файл
+        writer: csv.writer поверх csvfile
+        companies: Строки для записи
+        write_header: Записывать ли заголовок (файл новый/пустой)
+        
+    Returns:
+        Размер файла после записи
+    """
+    _write_rows(writer, companies, write_header)
+    csvfile.flush()
+    return os.fstat(csvfile.fileno()).st_size
+
+
+def _discard_failed_write_sync(csvfile, file_path: Path, size: int):
+    """
+    Закрытие файла после неудачной записи пакета и обрезка недописанных строк до размера size
+    
+    Повторная запись пакета тогда не дублирует строки, попавшие в файл до ошибки.
+    """
+    if csvfile is not None:
+        try:
+            csvfile.close()
+        except OSError:
+            pass  # Буфер с частью пакета отбрасывается
+    if file_path.exists():
+        os.truncate(file_path, size)
+
+
+def _read_existing_sync(file_path: Path) -> Tuple[Set[str], Set[str]]:
+    """
+    Синхронное чтение имен и slugs компаний из CSV файла (выполняется в отдельном потоке)
+    
+    Args:
+        file_path: Путь к CSV файлу
+        
+    Returns:
+        Имена компаний в нижнем регистре и их slugs
+    """
+    company_names: Set[str] = set()
+    slugs: Set[str] = set()
+    with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
+        # csv.reader без словаря на каждую строку: нужны только колонки company_name и slug_name
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if not header or 'company_name' not in header:
+            return company_names, slugs
+        
+        name_index = header.index('company_name')
+        slug_index = header.index('slug_name') if 'slug_name' in header else None
+        for row in reader:
+            if len(row) > name_index:
+                # Использование имени компании как уникального идентификатора
+                company_names.add(row[name_index].strip().lower())
+            if slug_index is not None and len(row) > slug_index:
+                slugs.add(row[slug_index].strip())
+    
+    company_names.discard('')
+    slugs.discard('')
+    return company_names, slugs
 
 
 class AsyncDSEICompanyScraper:
-    def __init__(self, config: Optional[Config] = None, max_concurrent_tasks: Optional[int] = None):
+    def __init__(self, config: Optional[Config] = None, max_concurrent_tasks: Optional[int] = None,
+                 stop_event: Optional[asyncio.Event] = None, transport: Optional[str] = None,
+                 output_file: Optional[str] = None, keep_in_memory: bool = False,
+                 requests_per_second: Optional[float] = None, burst: Optional[int] = None,
+                 use_cache: bool = True):
         """
         Инициализация асинхронного DSEI Company Scraper
         
         Args:
             config: Объект конфигурации. Если None, использует конфигурацию по умолчанию.
             max_concurrent_tasks: Максимальное количество одновременных задач. Если None, берет из конфигурации.
+            stop_event: Событие остановки. Если None, создается собственное.
+            transport: HTTP транспорт ('aiohttp' или 'httpx'). Если None, берет из конфигурации.
+            output_file: Путь к выходному CSV файлу. Если None, используется путь из конфигурации.
+            keep_in_memory: Хранить собранные компании в companies_data (для отладки).
+            requests_per_second: Ограничение частоты запросов (0 - без ограничения). Если None, берет из конфигурации.
+            burst: Максимальный всплеск запросов сверх частоты. Если None, берет из конфигурации.
+            use_cache: Использовать дисковый HTTP кэш, если он включен в конфигурации.
         """
         self.config = config or Config()
+        self.use_cache = use_cache
         
         # Определение количества одновременных задач
         if max_concurrent_tasks is None:
@@ -50,6 +231,9 @@ class AsyncDSEICompanyScraper:
         self.base_url = self.config.get_base_url()
         self.list_url_template = self.config.get_list_url_template()
         self.company_detail_url_template = self.config.get_company_detail_url_template()
+        # Шаблоны не меняются во время работы: связываем методы форматирования один раз
+        self._format_list_url = self.list_url_template.format
+        self._format_company_url = self.company_detail_url_template.format
         
         # Получение корня проекта для путей
         self.project_root = Path(__file__).parent.parent.parent
@@ -57,31 +241,65 @@ class AsyncDSEICompanyScraper:
         # Настройка логирования
         self._setup_logging()
         
-        # Хранение данных
-        self.companies_data = []
+        # Хранение данных: строки пишутся в CSV потоком, в памяти остается только счетчик
+        self.keep_in_memory = keep_in_memory
+        self.companies_data: List[Company] = []
+        self._count = 0
+        self.pages_scraped = 0
+        
+        # Очередь строк для потокового писателя CSV (создается на время скрапинга)
+        self._out_queue: Optional[asyncio.Queue] = None
         
         # Настройки из конфигурации
         self.delays = self.config.get_delays()
         self.timeouts = self.config.get_timeouts()
         self.selectors = self.config.get_selectors()
+        # Значения, нужные на каждой странице, вычисляются один раз
+        self._entry_sel = self.selectors.get('company_entry', DEFAULT_ENTRY_SELECTOR)
+        self._title_sel = self.selectors.get('company_title', DEFAULT_TITLE_SELECTOR)
+        self._cat_sel = self.selectors.get('categories', DEFAULT_CATEGORIES_SELECTOR)
+        self._desc_sel = self.selectors.get('description', DEFAULT_DESCRIPTION_SELECTOR)
         self.max_retries = 3
         
         # Отслеживание существующих компаний для избежания дубликатов
         self.existing_companies: Set[str] = set()
-        self.output_file_path = None
+        self.output_file_path: Optional[Path] = Path(output_file) if output_file else None
         self.processed_slugs: Set[str] = set()  # Отслеживание обработанных slugs во время текущей сессии
         
-        # Семафор для ограничения количества одновременных задач
+        # Семафор для ограничения количества одновременных HTTP запросов
         self.semaphore = asyncio.Semaphore(max_concurrent_tasks)
         
-        # Сессия будет создана в async методе
-        self.session: Optional[aiohttp.ClientSession] = None
+        # Ограничение частоты запросов (token bucket): предотвращает 429 вместо реакции на них.
+        # Без requests_per_second в конфигурации частота выводится из задержки между компаниями
+        async_config = self.config.get_async_config()
+        if requests_per_second is None:
+            requests_per_second = async_config.get('requests_per_second')
+        if requests_per_second is None and self.delays.get('between_companies'):
+            requests_per_second = 1 / self.delays['between_companies']
+        if burst is None:
+            burst = async_config.get('burst', max_concurrent_tasks)
+        self.limiter: Optional[AsyncTokenBucket] = None
+        if requests_per_second and requests_per_second > 0:
+            self.limiter = AsyncTokenBucket(capacity=max(burst, 1), refill_rate=requests_per_second)
         
-        # Флаг для обработки остановки пользователем
-        self.should_stop = False
+        # Общая пауза при защите сайта: сброшенное событие останавливает все новые запросы
+        self._requests_allowed = asyncio.Event()
+        self._requests_allowed.set()
         
-        # Настройка обработчиков сигналов
-        self._setup_signal_handlers()
+        # HTTP транспорт: httpx без установленного пакета заменяется на aiohttp
+        self.transport: str = transport or self.config.get('async_config.transport', 'aiohttp')
+        if self.transport not in TRANSPORTS:
+            raise ValueError(f"Неизвестный HTTP транспорт: {self.transport}")
+        if self.transport == 'httpx' and httpx is None:
+            self.logger.warning("Транспорт httpx выбран, но httpx не установлен: используется aiohttp")
+            self.transport = 'aiohttp'
+        
+        # Сессия (aiohttp) или клиент (httpx) будут созданы в async методе
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._client: Optional["httpx.AsyncClient"] = None
+        
+        # Событие остановки: будит ожидающие задачи сразу при получении сигнала
+        self.stop_event = stop_event or asyncio.Event()
     
     def _setup_logging(self):
         """Настройка конфигурации логирования"""
@@ -93,41 +311,104 @@ class AsyncDSEICompanyScraper:
         # Очистка существующих обработчиков для избежания дублирования
         logging.getLogger().handlers.clear()
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        self._log_handlers = [
+            logging.FileHandler(log_file, encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        for handler in self._log_handlers:
+            handler.setFormatter(formatter)
+        
+        # Задачи только кладут записи в очередь, а запись в файл и консоль выполняет
+        # отдельный поток QueueListener, не блокируя цикл событий
+        log_queue: queue.Queue = queue.Queue(-1)
+        self._log_listener: Optional[QueueListener] = QueueListener(log_queue, *self._log_handlers,
+                                                                    respect_handler_level=True)
+        self._log_listener.start()
+        
+        root = logging.getLogger()
+        root.setLevel(logging.INFO)
+        root.addHandler(QueueHandler(log_queue))
         self.logger = logging.getLogger(__name__)
     
-    def _setup_signal_handlers(self):
-        """Настройка обработчиков сигналов для корректного завершения"""
-        def signal_handler(signum, frame):
-            self.logger.info(f"🛑 Получен сигнал {signum}. Подготовка к корректному завершению...")
-            self.should_stop = True
+    def _stop_log_listener(self):
+        """
+        Остановка потока логирования с выводом оставшихся записей
         
-        # Настройка обработчиков для SIGINT (Ctrl+C) и SIGTERM
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-    
-    async def _create_session(self):
-        """Создание асинхронной HTTP сессии"""
-        async_config = self.config.get_async_config()
+        Обработчики файла и консоли возвращаются корневому логгеру, так что
+        записи после остановки выводятся напрямую.
+        """
+        if self._log_listener is None:
+            return
+        self._log_listener.stop()
+        self._log_listener = None
         
-        timeout = aiohttp.ClientTimeout(
-            total=self.timeouts.get('request_timeout', 30),
-            connect=async_config.get('connection_timeout', 10),
-            sock_read=async_config.get('read_timeout', 30)
-        )
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, QueueHandler):
+                root.removeHandler(handler)
+        for handler in self._log_handlers:
+            root.addHandler(handler)
+    
+    @property
+    def companies_count(self) -> int:
+        """Количество компаний, собранных за запуск"""
+        return self._count
+    
+    @property
+    def should_stop(self) -> bool:
+        """Флаг остановки пользователем"""
+        return self.stop_event.is_set()
+    
+    @should_stop.setter
+    def should_stop(self, value: bool):
+        if value:
+            self.stop_event.set()
+        else:
+            self.stop_event.clear()
+    
+    def _handle_stop_signal(self, signum: int):
+        """Обработчик сигнала остановки, вызывается в цикле событий"""
+        self.logger.info(f"🛑 Получен сигнал {signum}. Подготовка к корректному завершению...")
+        self.stop_event.set()
+    
+    def install_signal_handlers(self):
+        """
+        Настройка обработчиков SIGINT (Ctrl+C) и SIGTERM для корректного завершения
         
-        headers = {
+        Должна вызываться внутри работающего цикла событий.
+        """
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._handle_stop_signal, signum)
+            except NotImplementedError:
+                # Цикл событий без поддержки add_signal_handler (например, Windows)
+                signal.signal(signum, lambda sig, frame: loop.call_soon_threadsafe(self._handle_stop_signal, sig))
+    
+    async def __aenter__(self) -> "AsyncDSEICompanyScraper":
+        """Открытие общей HTTP сессии на всё время работы скрапера"""
+        await self._create_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Закрытие общей HTTP сессии и остановка потока логирования"""
+        await self._close_session()
+        self._stop_log_listener()
+    
+    def _has_open_session(self) -> bool:
+        """Открыта ли HTTP сессия выбранного транспорта"""
+        if self.transport == 'httpx':
+            return self._client is not None and not self._client.is_closed
+        return self.session is not None and not self.session.closed
+    
+    def _request_headers(self) -> Dict[str, str]:
+        """Заголовки, отправляемые с каждым запросом"""
+        return {
             'User-Agent': self.config.get_user_agent(),
             'Accept': '*/*',
             'Accept-Language': 'ru,en-US;q=0.7,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate, br, zstd',
+            'Accept-Encoding': _accept_encoding(self.transport),
             'X-Requested-With': 'XMLHttpRequest',
             'DNT': '1',
             'Connection': 'keep-alive',
@@ -138,27 +419,145 @@ class AsyncDSEICompanyScraper:
             'Sec-GPC': '1',
             'Priority': 'u=0'
         }
+    
+    async def _create_session(self):
+        """Создание асинхронной HTTP сессии (одна на весь запуск)"""
+        if self._has_open_session():
+            return
         
-        # Ограничение соединений из конфигурации
+        if self.transport == 'httpx':
+            self._create_httpx_client()
+            return
+        
+        async_config = self.config.get_async_config()
+        
+        timeout = aiohttp.ClientTimeout(
+            total=self.timeouts.get('request_timeout', 30),
+            connect=async_config.get('connection_timeout', 10),
+            sock_read=async_config.get('read_timeout', 30)
+        )
+        
+        headers = self._request_headers()
+        
+        # Ограничение соединений: на хост не больше, чем одновременных задач
+        # (TCP_NODELAY aiohttp включает на каждом соединении сам)
         connector = aiohttp.TCPConnector(
-            limit=async_config.get('connection_pool_size', 20),
-            limit_per_host=async_config.get('per_host_limit', 10),
+            limit=max(async_config.get('connection_pool_size', 20), self.max_concurrent_tasks),
+            limit_per_host=self.max_concurrent_tasks,
             ttl_dns_cache=300,
-            use_dns_cache=True
+            use_dns_cache=True,
+            keepalive_timeout=async_config.get('keepalive_timeout', 60)
         )
         
-        self.session = aiohttp.ClientSession(
-            timeout=timeout,
-            headers=headers,
-            connector=connector
+        # Дисковый HTTP кэш: повторные запуски не скачивают неизменившиеся страницы заново
+        http_cache = self.config.get_http_cache_config()
+        cache_enabled = self.use_cache and http_cache.get('enabled', False)
+        if cache_enabled and CachedSession is None:
+            self.logger.warning("HTTP кэш включен в конфигурации, но aiohttp-client-cache не установлен: кэш отключен")
+        if cache_enabled and CachedSession is not None:
+            cache_path = self.project_root / http_cache.get('path', 'data/raw/http_cache.sqlite')
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.session = CachedSession(
+                cache=SQLiteBackend(str(cache_path), expire_after=http_cache.get('expire_after', 86400)),
+                timeout=timeout,
+                headers=headers,
+                connector=connector
+            )
+            self.logger.info(f"HTTP кэш включен: {cache_path}")
+        else:
+            self.session = aiohttp.ClientSession(
+                timeout=timeout,
+                headers=headers,
+                connector=connector
+            )
+    
+    def _create_httpx_client(self):
+        """Создание клиента httpx с HTTP/2: запросы к одному хосту мультиплексируются в одном соединении"""
+        async_config = self.config.get_async_config()
+        
+        timeout = httpx.Timeout(
+            self.timeouts.get('request_timeout', 30),
+            connect=async_config.get('connection_timeout', 10),
+            read=async_config.get('read_timeout', 30)
         )
+        
+        # Заголовок Connection запрещен в HTTP/2
+        headers = self._request_headers()
+        del headers['Connection']
+        
+        # При HTTP/2 все запросы идут через одно соединение; запас в пуле нужен,
+        # если сервер согласует только HTTP/1.1
+        limits = httpx.Limits(
+            max_connections=self.max_concurrent_tasks,
+            max_keepalive_connections=self.max_concurrent_tasks,
+            keepalive_expiry=async_config.get('keepalive_timeout', 60)
+        )
+        
+        if self.use_cache and self.config.get_http_cache_config().get('enabled', False):
+            self.logger.info("HTTP кэш не поддерживается транспортом httpx: кэш отключен")
+        
+        # httpx пишет каждый запрос в лог на уровне INFO
+        logging.getLogger('httpx').setLevel(logging.WARNING)
+        
+        self._client = httpx.AsyncClient(http2=True, limits=limits, timeout=timeout, headers=headers,
+                                         follow_redirects=True)
+        self.logger.info("HTTP транспорт: httpx (HTTP/2)")
     
     async def _close_session(self):
         """Закрытие асинхронной HTTP сессии"""
         if self.session:
             await self.session.close()
+            self.session = None
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _get(self, url: str) -> Tuple[int, Optional[bytes], Optional[float]]:
+        """
+        GET запрос через выбранный транспорт
+        
+        Тело ответа не декодируется в строку: selectolax разбирает байты напрямую.
+        
+        Returns:
+            Код ответа, содержимое в байтах (None для кодов ошибок)
+            и пауза из заголовка Retry-After в секундах (только для кодов ошибок)
+        """
+        await self._requests_allowed.wait()
+        
+        async with self.semaphore:
+            if self.limiter is not None:
+                await self.limiter.acquire()
+            
+            if self._client is not None:
+                httpx_response = await self._client.get(url)
+                if httpx_response.status_code >= 400:
+                    return httpx_response.status_code, None, parse_retry_after(httpx_response.headers.get('Retry-After'))
+                return httpx_response.status_code, httpx_response.content, None
+            
+            assert self.session is not None, "HTTP сессия не создана"
+            async with self.session.get(url) as response:
+                if response.status >= 400:
+                    return response.status, None, parse_retry_after(response.headers.get('Retry-After'))
+                return response.status, await response.read(), None
+    
+    async def _pause_requests(self, seconds: float):
+        """
+        Приостановка всех запросов на время защиты сайта
+        
+        Первая задача, получившая 405/429, выдерживает паузу; остальные ждут ее окончания,
+        а не начинают собственные паузы.
+        """
+        if not self._requests_allowed.is_set():
+            await self._requests_allowed.wait()
+            return
+        
+        self._requests_allowed.clear()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self._requests_allowed.set()
     
-    async def make_request_with_retry(self, url: str) -> Optional[str]:
+    async def make_request_with_retry(self, url: str) -> Optional[bytes]:
         """
         Выполнение HTTP запроса с логикой повторных попыток и обработкой защиты сайта
         
@@ -166,9 +565,9 @@ class AsyncDSEICompanyScraper:
             url: URL для запроса
             
         Returns:
-            Содержимое ответа как строка или None если все попытки не удались
+            Содержимое ответа в байтах или None если все попытки не удались
         """
-        if not self.session:
+        if not self._has_open_session():
             await self._create_session()
             
         # Таймауты для защиты сайта (405, 429 ошибки)
@@ -176,49 +575,44 @@ class AsyncDSEICompanyScraper:
         
         for attempt in range(self.max_retries):
             try:
-                async with self.session.get(url) as response:
-                    # Обработка защиты сайта
-                    if response.status in [405, 429]:
-                        timeout_index = min(attempt, len(protection_timeouts) - 1)
-                        timeout_duration = protection_timeouts[timeout_index]
-                        
-                        self.logger.warning(
-                            f"Сайт защищается (код {response.status}) для {url}. "
-                            f"Ожидание {timeout_duration} секунд... (попытка {attempt + 1}/{self.max_retries})"
-                        )
-                        
-                        await asyncio.sleep(timeout_duration)
-                        continue
-                    
-                    response.raise_for_status()
-                    # Возвращаем содержимое как строку
-                    content = await response.text()
-                    return content
-                
-            except aiohttp.ClientResponseError as e:
-                # Обработка HTTP ошибок
-                if e.status in [405, 429]:
-                    timeout_index = min(attempt, len(protection_timeouts) - 1)
-                    timeout_duration = protection_timeouts[timeout_index]
-                    
-                    self.logger.warning(
-                        f"HTTP ошибка {e.status} для {url}. "
-                        f"Ожидание {timeout_duration} секунд... (попытка {attempt + 1}/{self.max_retries})"
-                    )
-                    
-                    await asyncio.sleep(timeout_duration)
-                    continue
-                else:
-                    self.logger.warning(f"HTTP ошибка {e.status} для {url}: {e}")
-                    if attempt < self.max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)  # Экспоненциальная задержка
-                    
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status, content, retry_after = await self._get(url)
+            except RETRYABLE_ERRORS as e:
                 self.logger.warning(f"Попытка {attempt + 1} не удалась для {url}: {e}")
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Экспоненциальная задержка
+                    await asyncio.sleep(backoff_delay(attempt))
                 else:
                     self.logger.error(f"Все {self.max_retries} попытки не удались для {url}")
+                continue
+            
+            if content is not None:
+                return content
+            
+            if status in PROTECTION_STATUSES:
+                # Обработка защиты сайта: общая пауза для всех задач, соединение уже освобождено.
+                # Пауза из Retry-After приоритетнее фиксированной шкалы
+                if retry_after is not None:
+                    timeout_duration = retry_after
+                else:
+                    timeout_index = min(attempt, len(protection_timeouts) - 1)
+                    timeout_duration = protection_timeouts[timeout_index]
+                
+                self.logger.warning(
+                    f"Сайт защищается (код {status}) для {url}. "
+                    f"Пауза всех запросов на {timeout_duration} секунд... (попытка {attempt + 1}/{self.max_retries})"
+                )
+                
+                await self._pause_requests(timeout_duration)
+                continue
+            
+            # Ошибки клиента (4xx) не исправятся повтором
+            if status < 500:
+                self.logger.warning(f"HTTP ошибка {status} для {url}")
+                return None
+            
+            # Повтор только для временных ошибок сервера (5xx)
+            self.logger.warning(f"HTTP ошибка {status} для {url}")
+            if attempt < self.max_retries - 1:
+                await asyncio.sleep(backoff_delay(attempt))
         
         return None
     
@@ -232,7 +626,9 @@ class AsyncDSEICompanyScraper:
         Returns:
             Количество загруженных существующих компаний
         """
-        if file_path is None:
+        if file_path is None and self.output_file_path is not None:
+            file_path = self.output_file_path
+        elif file_path is None:
             # Использование пути вывода по умолчанию
             data_dir = self.project_root / "data" / "processed"
             file_path = data_dir / self.config.get_output_config().get('csv_filename', 'dsei_companies.csv')
@@ -245,17 +641,14 @@ class AsyncDSEICompanyScraper:
             return 0
         
         try:
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as csvfile:
-                content = await csvfile.read()
-                reader = csv.DictReader(content.splitlines())
-                for row in reader:
-                    company_name = row.get('company_name', '').strip()
-                    if company_name:
-                        # Использование имени компании как уникального идентификатора
-                        self.existing_companies.add(company_name.lower())
+            # Чтение в отдельном потоке: файл читается построчно, без копии всего содержимого
+            company_names, slugs = await asyncio.to_thread(_read_existing_sync, file_path)
+            self.existing_companies.update(company_names)
+            # Slugs из файла пропускаются до запроса страницы компании
+            self.processed_slugs.update(slugs)
             
             count = len(self.existing_companies)
-            self.logger.info(f"Загружено {count} существующих компаний из {file_path}")
+            self.logger.info(f"Загружено {count} существующих компаний ({len(slugs)} slugs) из {file_path}")
             return count
             
         except Exception as e:
@@ -284,6 +677,96 @@ class AsyncDSEICompanyScraper:
         if company_name and company_name.strip():
             self.existing_companies.add(company_name.lower().strip())
     
+    def build_list_url(self, page_number: int) -> str:
+        """URL страницы списка компаний"""
+        return self._format_list_url(page=page_number)
+    
+    def build_company_url(self, company_slug: str, page_number: int) -> str:
+        """URL страницы с деталями компании"""
+        return self._format_company_url(company_slug=quote(company_slug), page=page_number)
+    
+    def _parse_list_page(self, response: bytes) -> Tuple[List[Dict[str, str]], int]:
+        """
+        Разбор страницы списка с помощью selectolax (lexbor)
+        
+        Дубликаты slugs отбрасываются за тот же проход с сохранением порядка.
+        
+        Args:
+            response: HTML страницы списка (байты)
+            
+        Returns:
+            Список словарей со slug компании и стендом и количество отброшенных дубликатов
+        """
+        tree = LexborHTMLParser(response)
+        companies_info = []
+        seen_slugs = set()
+        duplicates = 0
+        
+        for container in tree.css(LIST_ITEM_SELECTOR):
+            link = container.css_first(LIST_LINK_SELECTOR)
+            if link is None:
+                continue
+            
+            # Извлечение slug из href типа "javascript:openRemoteModal('exhibitors-list/wind-river','ajax'..."
+            slug = extract_slug(link.attributes.get('href') or '')
+            if not slug:
+                continue
+            if slug in seen_slugs:
+                duplicates += 1
+                continue
+            seen_slugs.add(slug)
+            
+            stand = ""
+            stand_element = container.css_first(LIST_STAND_SELECTOR)
+            if stand_element is not None:
+                stand = clean_stand(stand_element.text(strip=True))
+            
+            companies_info.append({
+                'slug': slug,
+                'stand': stand
+            })
+            self.logger.debug("Найден slug компании: %s, стенд: %s", slug, stand)
+        
+        return companies_info, duplicates
+    
+    def _parse_company_page(self, response: bytes) -> Tuple[str, List[str], str, str]:
+        """
+        Разбор страницы компании с помощью selectolax (lexbor)
+        
+        Args:
+            response: HTML страницы компании (байты)
+            
+        Returns:
+            Кортеж (имя компании, теги, описание, сайт)
+        """
+        tree = LexborHTMLParser(response)
+        # Поиск только внутри карточки компании: навигация и подвал страницы не обходятся
+        root = tree.css_first(self._entry_sel) or tree
+        
+        # Извлечение имени компании с использованием селектора из конфигурации
+        company_name = ""
+        title_element = root.css_first(self._title_sel)
+        if title_element is not None:
+            company_name = title_element.text(strip=True)
+        
+        # Извлечение тегов/категорий с использованием селектора из конфигурации
+        tags = []
+        for cat_elem in root.css(self._cat_sel):
+            tag = cat_elem.text(strip=True)
+            if tag:
+                tags.append(tag)
+        
+        # Извлечение обзора/описания с использованием селектора из конфигурации
+        overview = ""
+        description_element = root.css_first(self._desc_sel)
+        if description_element is not None:
+            overview = description_element.text(strip=True)
+        
+        # Извлечение URL сайта: первая внешняя ссылка (не внутренняя ссылка сайта)
+        website = find_website(root, description_element)
+        
+        return company_name, tags, overview, website
+    
     async def get_company_slugs_from_page(self, page_number: int) -> List[Dict[str, str]]:
         """
         ШАГ 1: Получение всей информации о компаниях со страницы списка
@@ -294,7 +777,7 @@ class AsyncDSEICompanyScraper:
         Returns:
             Список словарей, содержащих slug компании и информацию о стенде
         """
-        url = self.list_url_template.format(page=page_number)
+        url = self.build_list_url(page_number)
         self.logger.info(f"Получение страницы {page_number}: {url}")
         
         try:
@@ -302,53 +785,12 @@ class AsyncDSEICompanyScraper:
             if not response:
                 return []
             
-            soup = BeautifulSoup(response, 'html.parser')
-            
-            # Поиск всех блоков компаний с использованием основного контейнера
-            companies_info = []
-            # Сначала найдем все основные контейнеры компаний
-            company_containers = soup.find_all('li', class_='m-exhibitors-list__items__item')
-
-            for container in company_containers:
-                if isinstance(container, Tag):
-                    # Поиск ссылки внутри этого контейнера
-                    link = container.find('a', class_='js-librarylink-entry')
-                    if link and isinstance(link, Tag):
-                        href = link.get('href', '') or ''
-                        # Извлечение slug из href типа "javascript:openRemoteModal('exhibitors-list/wind-river','ajax'..."
-                        if isinstance(href, str):
-                            match = re.search(r"'exhibitors-list/([^']+)'", href)
-                            if match:
-                                slug = match.group(1)
-                                
-                                # Поиск информации о стенде в том же контейнере
-                                stand = ""
-                                stand_element = container.find('div', class_='m-exhibitors-list__items__item__header__meta__stand')
-                                if stand_element:
-                                    stand_text = stand_element.get_text(strip=True)
-                                    # Извлечение только номера стенда (удаление префикса "Stand: ")
-                                    if stand_text.startswith('Stand:'):
-                                        stand = stand_text.replace('Stand:', '').strip()
-                                    else:
-                                        stand = stand_text
-                                
-                                companies_info.append({
-                                    'slug': slug,
-                                    'stand': stand
-                                })
-                                self.logger.debug(f"Найден slug компании: {slug}, стенд: {stand}")
-
-            # Удаление дубликатов с сохранением порядка
-            unique_companies = []
-            seen_slugs = set()
-            for company in companies_info:
-                if company['slug'] not in seen_slugs:
-                    unique_companies.append(company)
-                    seen_slugs.add(company['slug'])
-
-            if len(companies_info) != len(unique_companies):
-                self.logger.info(f"Удалено {len(companies_info) - len(unique_companies)} дублирующихся slugs на странице {page_number}")
-
+            # Разбор в отдельном потоке: цикл событий продолжает обслуживать HTTP запросы
+            unique_companies, duplicates = await asyncio.to_thread(self._parse_list_page, response)
+            
+            if duplicates:
+                self.logger.info(f"Удалено {duplicates} дублирующихся slugs на странице {page_number}")
+            
             self.logger.info(f"Найдено {len(unique_companies)} уникальных компаний на странице {page_number}")
             return unique_companies
             
@@ -356,7 +798,7 @@ class AsyncDSEICompanyScraper:
             self.logger.error(f"Ошибка получения страницы {page_number}: {e}")
             return []
     
-    async def get_company_details(self, company_slug: str, page_number: int, stand: str = "") -> Optional[Dict[str, str]]:
+    async def get_company_details(self, company_slug: str, page_number: int, stand: str = "") -> Optional[Company]:
         """
         ШАГ 2: Получение подробной информации о компании с использованием slug компании
         
@@ -366,116 +808,46 @@ class AsyncDSEICompanyScraper:
             stand: Информация о стенде со страницы списка
             
         Returns:
-            Словарь с деталями компании или None если не удалось
+            Детали компании или None если не удалось
         """
         # Проверка флага остановки
         if self.should_stop:
-            self.logger.debug(f"🛑 Пропуск обработки {company_slug} - получен сигнал остановки")
+            self.logger.debug("🛑 Пропуск обработки %s - получен сигнал остановки", company_slug)
             return None
             
-        async with self.semaphore:  # Ограничение одновременных запросов
-            url = self.company_detail_url_template.format(
-                company_slug=quote(company_slug), 
-                page=page_number
-            )
-            
-            self.logger.debug(f"Получение деталей компании: {url}")
-            
-            try:
-                response = await self.make_request_with_retry(url)
-                if not response:
-                    return None
-                
-                soup = BeautifulSoup(response, 'html.parser')
-                
-                # Извлечение имени компании с использованием селектора из конфигурации
-                company_name = ""
-                title_selector = self.selectors.get('company_title', 'h1.m-exhibitor-entry__item__header__title')
-                title_element = soup.select_one(title_selector)
-                if title_element:
-                    company_name = title_element.get_text(strip=True)
-                
-                # Проверка, существует ли компания уже - пропускаем если да
-                if company_name and self.is_company_already_scraped(company_name):
-                    self.logger.info(f"⏭️  Пропуск {company_name} - уже существует в выходном файле")
-                    return None
-                
-                # Извлечение тегов/категорий с использованием селектора из конфигурации
-                tags = []
-                category_selector = self.selectors.get('categories', 'li.m-exhibitor-entry__item__header__categories__item')
-                category_elements = soup.select(category_selector)
-                for cat_elem in category_elements:
-                    tag = cat_elem.get_text(strip=True)
-                    if tag:
-                        tags.append(tag)
-                
-                # Извлечение обзора/описания с использованием селектора из конфигурации
-                overview = ""
-                desc_selector = self.selectors.get('description', 'div.m-exhibitor-entry__item__body__description')
-                description_element = soup.select_one(desc_selector)
-                if description_element:
-                    overview = description_element.get_text(strip=True)
-                
-                # Извлечение URL сайта
-                website = ""
-                website_elements = soup.find_all('a', href=True)
-                for link in website_elements:
-                    if isinstance(link, Tag):
-                        href = link.get('href', '') or ''
-                        # Поиск внешних URL (не внутренних ссылок сайта)
-                        if isinstance(href, str) and href.startswith('http') and 'dsei.co.uk' not in href:
-                            website = href
-                            break
-                
-                # Генерация полного URL компании
-                company_url = self.company_detail_url_template.format(
-                    company_slug=quote(company_slug), 
-                    page=page_number
-                )
-                
-                company_data = {
-                    'company_name': company_name,
-                    'slug_name': company_slug,
-                    'url': company_url,
-                    'stand': stand,
-                    'tags': '; '.join(tags),  # Объединение тегов точкой с запятой
-                    'overview': overview.replace('\n', ' ').replace('\r', ' '),  # Очистка переносов строк
-                    'website': website
-                }
-                
-                self.logger.debug(f"Извлечены данные для {company_name}")
-                return company_data
-                
-            except Exception as e:
-                self.logger.error(f"Ошибка получения деталей для {company_slug}: {e}")
-                return None
-    
-    async def has_next_page(self, page_number: int) -> bool:
-        """
-        Проверка наличия дополнительных страниц для обработки
+        url = self.build_company_url(company_slug, page_number)
         
-        Args:
-            page_number: Текущий номер страницы
-            
-        Returns:
-            True если есть еще страницы, False в противном случае
-        """
-        url = self.list_url_template.format(page=page_number + 1)
+        self.logger.debug("Получение деталей компании: %s", url)
         
         try:
             response = await self.make_request_with_retry(url)
             if not response:
-                return False
+                return None
             
-            soup = BeautifulSoup(response, 'html.parser')
+            # Разбор в отдельном потоке: цикл событий продолжает обслуживать HTTP запросы
+            company_name, tags, overview, website = await asyncio.to_thread(self._parse_company_page, response)
             
-            # Проверка наличия ссылок на компании на следующей странице
-            company_links = soup.find_all('a', class_='js-librarylink-entry')
+            # Проверка, существует ли компания уже - пропускаем если да
+            if company_name and self.is_company_already_scraped(company_name):
+                self.logger.info(f"⏭️  Пропуск {company_name} - уже существует в выходном файле")
+                return None
+            
+            company_data = Company(
+                company_name=company_name,
+                slug_name=company_slug,
+                url=url,  # Полный URL компании совпадает с URL запроса
+                stand=stand,
+                tags='; '.join(tags),  # Объединение тегов точкой с запятой
+                overview=collapse_line_breaks(overview),  # Очистка переносов строк
+                website=website
+            )
             
-            return len(company_links) > 0
+            self.logger.debug("Извлечены данные для %s", company_name)
+            return company_data
             
-        except Exception:
-            return False
+        except Exception as e:
+            self.logger.error(f"Ошибка получения деталей для {company_slug}: {e}")
+            return None
     
     async def save_to_csv(self, filename: Optional[str] = None):
         """
@@ -500,26 +872,8 @@ class AsyncDSEICompanyScraper:
             # Проверка существования файла для определения необходимости записи заголовка
             file_exists = file_path.exists() and file_path.stat().st_size > 0
             
-            # Открытие в режиме добавления если файл существует, режиме записи если новый
-            mode = 'a' if file_exists else 'w'
-            
-            async with aiofiles.open(file_path, mode, encoding='utf-8', newline='') as csvfile:
-                fieldnames = ['company_name', 'slug_name', 'url', 'stand', 'tags', 'overview', 'website']
-                
-                # Создание CSV контента в памяти
-                import io
-                output = io.StringIO()
-                writer = csv.DictWriter(output, fieldnames=fieldnames)
-                
-                # Запись заголовка только если файл новый/пустой
-                if not file_exists:
-                    writer.writeheader()
-                
-                for company in self.companies_data:
-                    writer.writerow(company)
-                
-                # Запись в файл
-                await csvfile.write(output.getvalue())
+            # Запись в отдельном потоке, чтобы не блокировать цикл событий дисковым I/O
+            await asyncio.to_thread(_write_csv_sync, file_path, list(self.companies_data), not file_exists)
             
             action = "Добавлено" if file_exists else "Сохранено"
             self.logger.info(f"{action} {len(self.companies_data)} компаний в {file_path}")
@@ -527,195 +881,407 @@ class AsyncDSEICompanyScraper:
         except Exception as e:
             self.logger.error(f"Ошибка сохранения в CSV: {e}")
     
-    async def auto_save_progress(self):
+    async def _csv_writer_loop(self, file_path: Path):
         """
-        Автоматическое сохранение прогресса для защиты от потери данных
+        Единственный писатель CSV: забирает строки из очереди и дописывает их в файл пакетами
+        
+        Выходной файл открывается один раз на весь запуск. Пакет дописывается и сбрасывается на диск
+        при накоплении CSV_STREAM_BATCH_SIZE строк, не позже чем через CSV_FLUSH_INTERVAL секунд
+        после первой строки пакета и при получении сигнала завершения (None).
+        
+        Args:
+            file_path: Путь к выходному CSV файлу
         """
-        if self.companies_data:
-            # Создание резервного файла с временной меткой
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            data_dir = self.project_root / "data" / "processed"
-            data_dir.mkdir(parents=True, exist_ok=True)
-            backup_filename = f"dsei_companies_backup_{timestamp}.csv"
-            backup_path = data_dir / backup_filename
-            
-            try:
-                await self.save_to_csv(str(backup_path))
-                self.logger.info(f"💾 Автосохранение выполнено: {backup_path}")
-            except Exception as e:
-                self.logger.error(f"❌ Ошибка автосохранения: {e}")
+        file_size = file_path.stat().st_size if file_path.exists() else 0  # Размер после последней удачной записи
+        write_header = not file_size
+        out_queue = self._out_queue
+        assert out_queue is not None, "Очередь строк CSV не создана"
+        written = 0
+        batch: List[Company] = []
+        finished = False
+        write_failed = False  # Предыдущая запись пакета не удалась: повтор только по сроку
+        csvfile = None
+        writer = None
+        loop = asyncio.get_running_loop()
+        flush_at = 0.0  # Срок сброса текущего пакета
+        
+        try:
+            while not finished:
+                # Срок отсчитывается от первой строки пакета, а не от последней: при медленном
+                # потоке строк они не задерживаются в буфере дольше CSV_FLUSH_INTERVAL
+                timeout = max(flush_at - loop.time(), 0) if batch else CSV_FLUSH_INTERVAL
+                try:
+                    row = await asyncio.wait_for(out_queue.get(), timeout=timeout)
+                    timed_out = False
+                except asyncio.TimeoutError:
+                    row = None
+                    timed_out = True
+                
+                if row is not None:
+                    if not batch:
+                        flush_at = loop.time() + CSV_FLUSH_INTERVAL
+                    batch.append(row)
+                    timed_out = loop.time() >= flush_at
+                elif not timed_out:
+                    finished = True
+                
+                full = len(batch) >= CSV_STREAM_BATCH_SIZE and not write_failed
+                if batch and (finished or timed_out or full):
+                    try:
+                        if csvfile is None:
+                            csvfile = await asyncio.to_thread(open, file_path, 'a', encoding='utf-8', newline='',
+                                                              buffering=1 << 20)
+                            writer = csv.writer(csvfile)
+                        file_size = await asyncio.to_thread(_append_rows_sync, csvfile, writer, batch, write_header)
+                    except Exception as e:
+                        # Файл открывается заново без частично записанных строк пакета
+                        try:
+                            await asyncio.to_thread(_discard_failed_write_sync, csvfile, file_path, file_size)
+                        except OSError as truncate_error:
+                            self.logger.error(f"Не удалось отбросить частично записанные строки: {truncate_error}")
+                        csvfile = None
+                        if finished:
+                            # Последняя попытка: строки не должны пропасть молча
+                            self.logger.error(f"Ошибка потоковой записи в CSV, {len(batch)} компаний не сохранено: {e}")
+                            raise
+                        # Пакет сохраняется и записывается повторно через CSV_FLUSH_INTERVAL вместе с новыми строками
+                        self.logger.error(f"Ошибка потоковой записи в CSV, повтор через {CSV_FLUSH_INTERVAL} с: {e}")
+                        write_failed = True
+                        flush_at = loop.time() + CSV_FLUSH_INTERVAL
+                        continue
+                    write_header = False
+                    write_failed = False
+                    written += len(batch)
+                    self.logger.debug("💾 Записано %d компаний в %s", len(batch), file_path)
+                    batch = []
+        finally:
+            if csvfile is not None:
+                await asyncio.to_thread(csvfile.close)
+        
+        if written:
+            self.logger.info(f"Сохранено {written} компаний в {file_path}")
     
-    async def process_companies_batch(self, companies_info: List[Dict[str, str]], page_number: int) -> List[Dict[str, str]]:
+    async def _fetch_and_emit(self, company_slug: str, page_number: int, stand: str = "") -> Optional[Company]:
         """
-        Асинхронная обработка пакета компаний
+        Получение деталей компании и передача строки потоковому писателю CSV
         
         Args:
-            companies_info: Список информации о компаниях (slug и stand)
-            page_number: Номер текущей страницы
+            company_slug: URL slug компании
+            page_number: Текущий номер страницы для API вызова
+            stand: Информация о стенде со страницы списка
             
         Returns:
-            Список успешно обработанных компаний
+            Словарь с деталями компании или None если не удалось
         """
-        # Фильтрация уже обработанных slugs
-        companies_to_process = [
-            company for company in companies_info 
-            if company['slug'] not in self.processed_slugs
-        ]
+        company_data = await self.get_company_details(company_slug, page_number, stand)
+        if company_data and self._out_queue is not None:
+            await self._out_queue.put(company_data)
+        return company_data
+    
+    async def _wait_for_stop(self):
+        """Ожидание сигнала остановки внутри TaskGroup"""
+        await self.stop_event.wait()
+        raise _StopRequested()
+    
+    def _record_company(self, company_slug: str, company_data: Optional[Company]):
+        """
+        Учет результата обработки компании (строка уже отправлена писателю CSV)
         
-        if len(companies_to_process) < len(companies_info):
-            skipped = len(companies_info) - len(companies_to_process)
-            self.logger.info(f"⏭️  Пропуск {skipped} slugs - уже обработаны в текущей сессии")
+        Args:
+            company_slug: URL slug компании
+            company_data: Детали компании или None
+        """
+        if company_data is None:
+            # Может быть дубликат
+            self.logger.debug("⏭️  Нет данных для %s (возможно, дубликат)", company_slug)
+            return
         
-        # Создание задач для асинхронной обработки
-        tasks = []
-        for company_info in companies_to_process:
-            # Проверка флага остановки
-            if self.should_stop:
-                self.logger.info("🛑 Получен сигнал остановки во время создания задач...")
-                break
-                
-            slug = company_info['slug']
-            stand = company_info['stand']
-            
-            # Отметка slug как обработанного
-            self.processed_slugs.add(slug)
-            
-            # Создание задачи с небольшой задержкой между запросами
-            task = self.get_company_details(slug, page_number, stand)
-            tasks.append(task)
-        
-        # Выполнение всех задач одновременно с ограничением семафора
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Фильтрация успешных результатов
-        successful_companies = []
-        for i, result in enumerate(results):
-            if isinstance(result, dict):
-                successful_companies.append(result)
-                # Добавление в набор существующих компаний для предотвращения повторной обработки
-                self.add_company_to_existing(result['company_name'])
-                self.logger.info(f"✅ Обработано: {result['company_name']}")
-            elif isinstance(result, Exception):
-                slug = companies_to_process[i]['slug']
-                self.logger.error(f"❌ Ошибка обработки {slug}: {result}")
-            else:
-                # result is None - может быть дубликат
-                slug = companies_to_process[i]['slug']
-                self.logger.debug(f"⏭️  Нет данных для {slug} (возможно, дубликат)")
+        self._count += 1
+        if self.keep_in_memory:
+            self.companies_data.append(company_data)
+        # Добавление в набор существующих компаний для предотвращения повторной обработки
+        self.add_company_to_existing(company_data.company_name)
+        self.logger.debug("✅ Обработано: %s", company_data.company_name)
+        if self._count % LOG_PROGRESS_EVERY == 0:
+            self.logger.info(f"✅ Обработано компаний: {self._count}")
+    
+    async def _detail_worker(self, jobs: asyncio.Queue):
+        """
+        Потребитель: забирает компании из очереди и получает их детали, пока не получит None
         
-        return successful_companies
+        Args:
+            jobs: Очередь кортежей (slug, стенд, номер страницы)
+        """
+        while True:
+            job = await jobs.get()
+            if job is None:
+                return
+            
+            company_slug, stand, page_number = job
+            try:
+                company_data = await self._fetch_and_emit(company_slug, page_number, stand)
+            except Exception as e:
+                self.logger.error(f"❌ Ошибка обработки {company_slug}: {e}")
+                continue
+            
+            self._record_company(company_slug, company_data)
     
-    async def scrape_all_companies(self, start_page: int = 1, max_pages: Optional[int] = None):
+    async def _produce_company_jobs(self, jobs: asyncio.Queue, start_page: int, max_pages: Optional[int],
+                                    workers: int):
         """
-        Основной метод скрапинга, который следует логике блок-схемы
+        Производитель: обходит страницы списка и ставит компании в очередь потребителей
+        
+        Списочные страницы загружаются окном по LIST_PAGE_WINDOW штук одновременно; первая пустая
+        страница означает конец пагинации. По завершении каждому потребителю отправляется None.
         
         Args:
+            jobs: Очередь кортежей (slug, стенд, номер страницы)
             start_page: Номер страницы для начала
             max_pages: Максимальное количество страниц для обработки (None для всех)
+            workers: Количество потребителей
         """
-        self.logger.info(f"🚀 Запуск асинхронного DSEI скрапера компаний (макс. {self.max_concurrent_tasks} одновременных задач)")
-        
-        # Создание HTTP сессии
-        await self._create_session()
+        list_tasks: Dict[asyncio.Task, int] = {}
+        next_page = start_page
+        last_page = start_page + max_pages - 1 if max_pages else None
+        end_page: Optional[int] = None  # Первая пустая страница
         
         try:
-            # Загрузка существующих компаний для избежания дубликатов
-            await self.load_existing_companies()
-            
-            current_page = start_page
-            pages_scraped = 0
-            
             while True:
                 # Проверка флага остановки
                 if self.should_stop:
                     self.logger.info("🛑 Получен сигнал остановки. Завершение текущей обработки...")
                     break
                 
-                # Проверка ограничения максимального количества страниц
-                if max_pages and pages_scraped >= max_pages:
-                    self.logger.info(f"🏁 Достигнуто ограничение максимального количества страниц: {max_pages}")
-                    break
-                
-                # ШАГ 1: Получение slugs компаний с текущей страницы
-                companies_info = await self.get_company_slugs_from_page(current_page)
-                
-                # Проверка наличия компаний на странице (точка принятия решения в блок-схеме)
-                if not companies_info:
-                    self.logger.info(f"🏁 Компании не найдены на странице {current_page}. Парсинг завершен.")
-                    break
+                # Дозаполнение окна загрузки списочных страниц
+                while (len(list_tasks) < LIST_PAGE_WINDOW
+                       and (last_page is None or next_page <= last_page)
+                       and (end_page is None or next_page < end_page)):
+                    task = asyncio.create_task(self.get_company_slugs_from_page(next_page))
+                    list_tasks[task] = next_page
+                    next_page += 1
                 
-                # Проверка флага остановки перед обработкой
-                if self.should_stop:
-                    self.logger.info("🛑 Получен сигнал остановки перед обработкой компаний...")
+                if not list_tasks:
+                    if last_page is not None and end_page is None:
+                        self.logger.info(f"🏁 Достигнуто ограничение максимального количества страниц: {max_pages}")
                     break
                 
-                # ШАГ 2: Асинхронная обработка каждой компании
-                self.logger.info(f"⚡ Начинается асинхронная обработка {len(companies_info)} компаний со страницы {current_page}")
-                
-                batch_results = await self.process_companies_batch(companies_info, current_page)
-                
-                # Добавление результатов к общим данным
-                self.companies_data.extend(batch_results)
-                
-                self.logger.info(f"✅ Завершена обработка страницы {current_page}: {len(batch_results)} новых компаний")
-                
-                # Автосохранение после каждой страницы (каждые 5 страниц)
-                if pages_scraped % 5 == 0 and self.companies_data:
-                    await self.auto_save_progress()
+                # ШАГ 1: Получение slugs компаний с первой загруженной страницы окна
+                done, _ = await asyncio.wait(list_tasks, return_when=asyncio.FIRST_COMPLETED)
                 
-                # Проверка наличия следующей страницы (точка принятия решения в блок-схеме)
-                if not await self.has_next_page(current_page):
-                    self.logger.info("🏁 Больше страниц не найдено. Парсинг завершен.")
-                    break
-                
-                # Переход к следующей странице
-                current_page += 1
-                pages_scraped += 1
-                
-                # Добавление задержки между страницами
-                if self.delays.get('between_pages', 0) > 0:
-                    await asyncio.sleep(self.delays.get('between_pages', 2))
+                for task in sorted(done, key=list_tasks.__getitem__):
+                    current_page = list_tasks.pop(task, None)
+                    if current_page is None:
+                        # Загрузка уже отброшена как следующая за пустой страницей
+                        continue
+                    companies_info = task.result()
+                    
+                    # Пустая страница означает конец пагинации: более поздние загрузки отменяются
+                    if not companies_info:
+                        self.logger.info(f"🏁 Компании не найдены на странице {current_page}. Парсинг завершен.")
+                        if end_page is None or current_page < end_page:
+                            end_page = current_page
+                        for pending, page in list(list_tasks.items()):
+                            if page > current_page:
+                                pending.cancel()
+                                del list_tasks[pending]
+                        continue
+                    
+                    # ШАГ 2: Передача компаний потребителям (уже обработанные slugs пропускаются)
+                    new_companies = [company for company in companies_info if company['slug'] not in self.processed_slugs]
+                    self.processed_slugs.update(company['slug'] for company in new_companies)
+                    for company in new_companies:
+                        await jobs.put((company['slug'], company['stand'], current_page))
+                    
+                    queued = len(new_companies)
+                    skipped = len(companies_info) - queued
+                    if skipped:
+                        self.logger.info(f"⏭️  Пропуск {skipped} slugs - уже обработаны в текущей сессии")
+                    self.logger.info(f"⚡ Страница {current_page}: {queued} компаний поставлено в очередь")
+                    
+                    self.pages_scraped += 1
+        finally:
+            # Отмена загрузок списочных страниц, которые больше не нужны
+            for task in list_tasks:
+                task.cancel()
+        
+        # Сигнал завершения потребителям: они дорабатывают оставшуюся очередь и выходят
+        for _ in range(workers):
+            await jobs.put(None)
+    
+    async def _run_pipeline_task_group(self, start_page: int, max_pages: Optional[int]):
+        """
+        Запуск производителя и потребителей в asyncio.TaskGroup (Python 3.11+)
+        
+        При сигнале остановки группа отменяет все незавершенные задачи и дожидается их,
+        так что соединения возвращаются в пул до выхода из метода.
+        """
+        jobs: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent_tasks * JOB_QUEUE_PER_WORKER)
+        workers = []
+        try:
+            async with asyncio.TaskGroup() as group:
+                workers = [group.create_task(self._detail_worker(jobs)) for _ in range(self.max_concurrent_tasks)]
+                group.create_task(self._produce_company_jobs(jobs, start_page, max_pages, len(workers)))
+                stop_waiter = group.create_task(self._wait_for_stop())
+                await asyncio.wait(workers)
+                stop_waiter.cancel()
+        except BaseExceptionGroup as group_error:
+            stop_requested, other_errors = group_error.split(_StopRequested)
+            if other_errors is not None:
+                raise other_errors
+            self.logger.info("🛑 Получен сигнал остановки. Незавершенные задачи отменены")
+    
+    async def _run_pipeline_gather(self, start_page: int, max_pages: Optional[int]):
+        """
+        Запуск производителя и потребителей через asyncio.gather (Python < 3.11)
+        """
+        jobs: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent_tasks * JOB_QUEUE_PER_WORKER)
+        tasks = [asyncio.create_task(self._detail_worker(jobs)) for _ in range(self.max_concurrent_tasks)]
+        tasks.append(asyncio.create_task(self._produce_company_jobs(jobs, start_page, max_pages, len(tasks))))
+        
+        pipeline = asyncio.gather(*tasks)
+        stop_waiter = asyncio.create_task(self.stop_event.wait())
+        try:
+            waiters: Set[asyncio.Future] = {pipeline, stop_waiter}
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop_waiter.cancel()
+        
+        if pipeline.done():
+            if pipeline.exception() is not None:
+                for task in tasks:
+                    task.cancel()
+            pipeline.result()
+            return
+        
+        self.logger.info("🛑 Получен сигнал остановки. Незавершенные задачи отменены")
+        pipeline.cancel()
+        try:
+            await pipeline
+        except asyncio.CancelledError:
+            pass
+    
+    async def scrape_all_companies(self, start_page: int = 1, max_pages: Optional[int] = None):
+        """
+        Основной метод скрапинга, который следует логике блок-схемы
+        
+        Страницы списка и страницы компаний обрабатываются конвейером: производитель ставит компании
+        в очередь, пока потребители получают детали уже найденных компаний.
+        
+        Args:
+            start_page: Номер страницы для начала
+            max_pages: Максимальное количество страниц для обработки (None для всех)
+        """
+        self.logger.info(f"🚀 Запуск асинхронного DSEI скрапера компаний (макс. {self.max_concurrent_tasks} одновременных задач)")
+        
+        # Создание HTTP сессии, если скрапер не открыт через async with
+        owns_session = not self._has_open_session()
+        if owns_session:
+            await self._create_session()
+        
+        writer_task: Optional[asyncio.Task] = None
+        self.pages_scraped = 0
+        
+        try:
+            # Загрузка существующих компаний для избежания дубликатов
+            await self.load_existing_companies()
+            # load_existing_companies задает путь выходного файла (по умолчанию из конфигурации)
+            output_path = self.output_file_path
+            assert output_path is not None
             
-            # Финальный отчет
-            self.logger.info(f"🎉 Скрапинг завершен. Всего собрано компаний: {len(self.companies_data)}")
-            self.logger.info(f"📄 Обработано страниц: {pages_scraped + 1}")
+            # Запуск писателя CSV, который дописывает строки в выходной файл по мере их получения
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._out_queue = asyncio.Queue(maxsize=CSV_QUEUE_SIZE)
+            writer_task = asyncio.create_task(self._csv_writer_loop(output_path))
+            
+            if HAS_TASK_GROUP:
+                await self._run_pipeline_task_group(start_page, max_pages)
+            else:
+                await self._run_pipeline_gather(start_page, max_pages)
             
-            # Сохранение данных в CSV
-            await self.save_to_csv()
+            # Финальный отчет
+            if self.should_stop:
+                self.logger.warning(f"⏹️ Скрапинг прерван сигналом остановки. Собрано компаний до остановки: {self._count}")
+            else:
+                self.logger.info(f"🎉 Скрапинг завершен. Всего собрано компаний: {self._count}")
+            self.logger.info(f"📄 Обработано страниц: {self.pages_scraped}")
             
         except KeyboardInterrupt:
             self.logger.info("⏹️ Скрапинг прерван пользователем (Ctrl+C)")
-            if self.companies_data:
-                self.logger.info(f"💾 Сохранение {len(self.companies_data)} компаний, собранных до сих пор...")
-                await self.save_to_csv()
-                await self.auto_save_progress()  # Дополнительное резервное сохранение
+            if self._count:
+                self.logger.info(f"💾 {self._count} компаний, собранных до сих пор, дописываются в {self.output_file_path}")
         
         except Exception as e:
             self.logger.error(f"💥 Неожиданная ошибка: {e}")
-            if self.companies_data:
-                self.logger.info(f"💾 Сохранение {len(self.companies_data)} компаний, собранных до ошибки...")
-                await self.save_to_csv()
-                await self.auto_save_progress()  # Дополнительное резервное сохранение
+            if self._count:
+                self.logger.info(f"💾 {self._count} компаний, собранных до ошибки, дописываются в {self.output_file_path}")
         
         finally:
-            # Закрытие HTTP сессии
-            await self._close_session()
+            try:
+                # Сигнал завершения писателю CSV и ожидание сброса оставшихся строк;
+                # ошибка последней записи пробрасывается вызывающему
+                if writer_task and self._out_queue is not None:
+                    await self._out_queue.put(None)
+                    await writer_task
+            finally:
+                self._out_queue = None
+                
+                # Закрытие HTTP сессии, только если она была открыта здесь
+                if owns_session:
+                    await self._close_session()
+                    self._stop_log_listener()
+
+
+def use_uvloop() -> bool:
+    """
+    Установка uvloop в качестве политики цикла событий, если он установлен
+    
+    Должна вызываться до asyncio.run().
+    
+    Returns:
+        True если uvloop используется, False если остается стандартный цикл событий
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 # Функция-обертка для удобного запуска асинхронного скрапера
 async def run_async_scraper(config: Optional[Config] = None, 
                            start_page: int = 1, 
                            max_pages: Optional[int] = None,
-                           max_concurrent_tasks: int = 15):
+                           max_concurrent_tasks: int = 15,
+                           transport: Optional[str] = None,
+                           output_file: Optional[str] = None,
+                           requests_per_second: Optional[float] = None,
+                           burst: Optional[int] = None,
+                           use_cache: bool = True) -> Tuple[int, bool]:
     """
     Функция-обертка для запуска асинхронного скрапера
     
+    Ctrl+C / SIGTERM останавливают скрапинг корректно: уже собранные компании
+    к этому моменту записаны в CSV потоковым писателем.
+    
     Args:
         config: Объект конфигурации
         start_page: Начальная страница
         max_pages: Максимальное количество страниц
         max_concurrent_tasks: Максимальное количество одновременных задач
+        transport: HTTP транспорт ('aiohttp' или 'httpx')
+        output_file: Путь к выходному CSV файлу (по умолчанию из конфигурации)
+        requests_per_second: Ограничение частоты запросов (по умолчанию из конфигурации)
+        burst: Максимальный всплеск запросов (по умолчанию из конфигурации)
+        use_cache: Использовать дисковый HTTP кэш (если включен в конфигурации)
+        
+    Returns:
+        Количество собранных компаний и признак остановки по сигналу
     """
-    scraper = AsyncDSEICompanyScraper(config, max_concurrent_tasks)
-    await scraper.scrape_all_companies(start_page, max_pages)
+    async with AsyncDSEICompanyScraper(config, max_concurrent_tasks, transport=transport,
+                                       output_file=output_file, requests_per_second=requests_per_second,
+                                       burst=burst, use_cache=use_cache) as scraper:
+        scraper.install_signal_handlers()
+        await scraper.scrape_all_companies(start_page, max_pages)
+        return scraper.companies_count, scraper.should_stop
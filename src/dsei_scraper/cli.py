@@ -5,10 +5,9 @@ Command Line Interface for DSEI Company Scraper
 
 import sys
 import argparse
-from pathlib import Path
 
-from .scraper import DSEICompanyScraper
-from .config import Config
+# Exit status of a run stopped by Ctrl+C / SIGTERM (128 + SIGINT)
+EXIT_INTERRUPTED = 130
 
 
 def main():
@@ -23,6 +22,9 @@ Examples:
   %(prog)s --start-page 3           # Start from page 3
   %(prog)s --output companies.csv   # Custom output file
   %(prog)s --config custom.json     # Use custom config
+  %(prog)s --concurrency 30         # Fetch up to 30 pages at once
+  %(prog)s --sync                   # Use the sequential scraper
+  %(prog)s --no-cache               # Ignore the on-disk HTTP cache
         """
     )
     
@@ -34,12 +36,26 @@ Examples:
                        help='Path to configuration file')
     parser.add_argument('--output', type=str, default=None,
                        help='Output CSV file path')
+    parser.add_argument('--concurrency', type=int, default=15,
+                       help='Maximum number of concurrent requests (default: 15)')
+    parser.add_argument('--rps', type=float, default=None,
+                       help='Maximum requests per second, 0 for no limit (default: from config)')
+    parser.add_argument('--burst', type=int, default=None,
+                       help='Maximum burst of requests above --rps (default: from config)')
+    parser.add_argument('--sync', action='store_true',
+                       help='Use the sequential scraper instead of the async one')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not use the on-disk HTTP cache')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     parser.add_argument('--version', action='version', version='%(prog)s 1.0.0')
     
     args = parser.parse_args()
     
+    # Scraper modules pull in aiohttp/requests/selectolax, so they are imported only
+    # after argparse has handled --help/--version
+    from .config import Config
+    
     # Set up logging level
     if args.verbose:
         import logging
@@ -54,36 +70,60 @@ Examples:
         else:
             config = Config()
         
-        # Initialize scraper
-        scraper = DSEICompanyScraper(config)
-        
         print("🚀 Starting DSEI Company Scraper...")
         print(f"📄 Config: {config.config_path}")
         print(f"📊 Pages: {args.start_page} to {'all' if args.max_pages is None else args.start_page + args.max_pages - 1}")
         
+        if not args.sync:
+            # Rows are streamed to the CSV as they arrive, and Ctrl+C stops the
+            # async scraper gracefully, so there is nothing left to save here
+            import asyncio
+            from .async_scraper import run_async_scraper, use_uvloop
+            
+            use_uvloop()
+            total, interrupted = asyncio.run(run_async_scraper(
+                config,
+                start_page=args.start_page,
+                max_pages=args.max_pages,
+                max_concurrent_tasks=args.concurrency,
+                output_file=args.output,
+                requests_per_second=args.rps,
+                burst=args.burst,
+                use_cache=not args.no_cache
+            ))
+            
+            if interrupted:
+                # An interrupted run must not look like a complete one to callers
+                print("\n⏹️ Scraping stopped by a stop signal")
+                print(f"📊 Companies collected before stopping: {total}")
+                sys.exit(EXIT_INTERRUPTED)
+            
+            print("\n✅ Scraping completed successfully!")
+            print(f"📊 Total companies collected: {total}")
+            return
+        
+        from .scraper import DSEICompanyScraper
+        
+        # Initialize scraper
+        scraper = DSEICompanyScraper(config, use_cache=not args.no_cache, output_file=args.output,
+                                     requests_per_second=args.rps, burst=args.burst)
+        
         # Run scraper
         scraper.scrape_all_companies(
             start_page=args.start_page,
             max_pages=args.max_pages
         )
         
-        # Save with custom output file if specified
-        if args.output:
-            scraper.save_to_csv(args.output)
-        
-        print(f"\n✅ Scraping completed successfully!")
-        print(f"📊 Total companies collected: {len(scraper.companies_data)}")
+        print("\n✅ Scraping completed successfully!")
+        print(f"📊 Total companies collected: {scraper.companies_count}")
         
     except KeyboardInterrupt:
         print("\n⏹️ Scraping interrupted by user")
         
-        # Save partial results if any
-        if scraper and scraper.companies_data:
-            print(f"💾 Saving {len(scraper.companies_data)} companies collected so far...")
-            if args.output:
-                scraper.save_to_csv(args.output)
-            else:
-                scraper.save_to_csv()
+        # Save partial results if any: append the rows of the interrupted page to the output file
+        if scraper and scraper.companies_count:
+            print(f"💾 Saving {scraper.companies_count} companies collected so far...")
+            scraper.save_to_csv()
         
         sys.exit(1)
     
@@ -5,12 +5,23 @@ Configuration module for DSEI Company Scraper
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+
+def _flatten(d: Dict[str, Any], prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    """Yield every value of a nested dict under its dotted key, sections included"""
+    for key, value in d.items():
+        dotted = prefix + key
+        yield dotted, value
+        if isinstance(value, dict):
+            yield from _flatten(value, dotted + '.')
 
 
 class Config:
     """Configuration handler for the DSEI scraper"""
     
+    __slots__ = ('_config', '_flat', 'config_path')
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize configuration
@@ -26,6 +37,9 @@ class Config:
             self.config_path = Path(config_path)
         
         self._config = self._load_config()
+        
+        # Configuration is not modified after loading: every dotted key is resolved once
+        self._flat = dict(_flatten(self._config))
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file"""
@@ -51,19 +65,37 @@ class Config:
             "async_config": {
                 "max_concurrent_tasks": 15,
                 "connection_pool_size": 20,
-                "per_host_limit": 10,
                 "connection_timeout": 10,
-                "read_timeout": 30
+                "read_timeout": 30,
+                "keepalive_timeout": 60,
+                "requests_per_second": 10,
+                "burst": 15,
+                "transport": "aiohttp"
+            },
+            "sync_config": {
+                "list_page_size": None,
+                "detail_workers": 1,
+                "requests_per_second": None,
+                "burst": None,
+                "transport": "requests",
+                "list_workers": 1
             },
             "timeouts": {
                 "request_timeout": 30
             },
+            "http_cache": {
+                "enabled": True,
+                "path": "data/raw/http_cache.sqlite",
+                "sync_path": "data/raw/http_cache_sync.sqlite",
+                "expire_after": 86400
+            },
             "output": {
                 "csv_filename": "dsei_companies.csv",
                 "log_filename": "scraper.log"
             },
             "selectors": {
                 "company_links": "a.js-librarylink-entry",
+                "company_entry": "div.m-exhibitor-entry__item",
                 "company_title": "h1.m-exhibitor-entry__item__header__title",
                 "categories": "li.m-exhibitor-entry__item__header__categories__item",
                 "description": "div.m-exhibitor-entry__item__body__description",
@@ -74,16 +106,7 @@ class Config:
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def get_base_url(self) -> str:
         """Get base URL"""
@@ -105,6 +128,10 @@ class Config:
         """Get timeout settings"""
         return self.get('timeouts', {})
     
+    def get_http_cache_config(self) -> Dict[str, Any]:
+        """Get on-disk HTTP cache settings"""
+        return self.get('http_cache', {})
+    
     def get_output_config(self) -> Dict[str, str]:
         """Get output configuration"""
         return self.get('output', {})
@@ -121,6 +148,10 @@ class Config:
         """Get asynchronous configuration settings"""
         return self.get('async_config', {})
     
+    def get_sync_config(self) -> Dict[str, Any]:
+        """Get synchronous configuration settings"""
+        return self.get('sync_config', {})
+    
     @property
     def all(self) -> Dict[str, Any]:
         """Get all configuration"""
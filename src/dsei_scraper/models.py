@@ -0,0 +1,20 @@
+"""
+Data model for scraped DSEI companies
+"""
+
+from typing import NamedTuple
+
+
+class Company(NamedTuple):
+    """A scraped company; fields follow the output CSV column order, so a Company is a CSV row as is"""
+    company_name: str
+    slug_name: str
+    url: str
+    stand: str
+    tags: str
+    overview: str
+    website: str
+
+
+# Output CSV columns
+CSV_FIELDNAMES = list(Company._fields)
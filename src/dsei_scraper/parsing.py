@@ -0,0 +1,74 @@
+"""
+Page parsing helpers shared by the sync and async scrapers
+"""
+
+import re
+from typing import Optional
+from urllib.parse import urlsplit
+
+# A company slug in an href like "javascript:openRemoteModal('exhibitors-list/wind-river','ajax'..."
+# starts after this marker and ends at the next quote
+SLUG_MARKER = "'exhibitors-list/"
+# Prefix of the stand text on a list page
+STAND_PREFIX = 'Stand:'
+# Company website: first absolute link to a host outside the DSEI site (and its subdomains)
+WEBSITE_LINK_SELECTOR = 'a[href^="http"]'
+EXCLUDED_HOST = 'dsei.co.uk'
+# Each run of line breaks in the overview becomes a single space
+_LINE_BREAKS_RE = re.compile(r'[\r\n]+')
+
+
+def extract_slug(href: str) -> Optional[str]:
+    """Company slug of a list page link (string slicing instead of a regular expression)"""
+    start = href.find(SLUG_MARKER)
+    if start < 0:
+        return None
+    start += len(SLUG_MARKER)
+    end = href.find("'", start)
+    if end <= start:
+        return None
+    return href[start:end]
+
+
+def clean_stand(stand_text: str) -> str:
+    """Stand number only (the "Stand: " prefix removed)"""
+    return stand_text.removeprefix(STAND_PREFIX).strip()
+
+
+def collapse_line_breaks(text: str) -> str:
+    """
+    Replace every run of line breaks (CR/LF) with a single space
+    
+    Text without line breaks, the common case, is returned after two substring
+    checks instead of a regex scan.
+    """
+    if '\n' not in text and '\r' not in text:
+        return text
+    return _LINE_BREAKS_RE.sub(' ', text)
+
+
+def is_external_url(href: str) -> bool:
+    """Check that an absolute URL points outside the DSEI site"""
+    try:
+        host = urlsplit(href).hostname or ''
+    except ValueError:
+        # Malformed URL, e.g. an unclosed IPv6 bracket
+        return False
+    return bool(host) and host != EXCLUDED_HOST and not host.endswith('.' + EXCLUDED_HOST)
+
+
+def find_website(root, description_element) -> str:
+    """
+    First external link of a company page
+    
+    Only absolute links are visited, those inside the description first and
+    the rest of the company entry (root) only if the description has none.
+    """
+    for scope in (description_element, root):
+        if scope is None:
+            continue
+        for link in scope.css(WEBSITE_LINK_SELECTOR):
+            href = link.attributes.get('href') or ''
+            if is_external_url(href):
+                return href
+    return ""
@@ -13,41 +13,101 @@ Output CSV format: company_name, slug_name, url, stand, tags, overview, website
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 import csv
-import re
 import time
 import logging
-from bs4 import BeautifulSoup, Tag
-from urllib.parse import urljoin, quote
-from typing import List, Dict, Optional
-import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import quote
+from typing import IO, TYPE_CHECKING, Deque, Iterator, List, Dict, Optional, Set, Tuple, Union
 from pathlib import Path
 
 from .config import Config
+from .models import Company, CSV_FIELDNAMES
+from .parsing import clean_stand, collapse_line_breaks, extract_slug, find_website
+from .throttling import TokenBucket, backoff_delay, parse_retry_after
+
+if TYPE_CHECKING:
+    from _csv import Writer as CsvWriter  # Type returned by csv.writer()
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache not installed - HTTP cache disabled
+    requests_cache = None  # type: ignore[assignment]
+
+try:
+    import httpx
+except ImportError:  # httpx not installed - only the requests transport is available
+    httpx = None  # type: ignore[assignment]
+
+# HTTP clients: requests (HTTP/1.1, optional on-disk cache) or httpx (HTTP/2)
+TRANSPORTS = ('requests', 'httpx')
+# Errors after which a request is retried
+REQUEST_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+# Response codes retried: site protection (405, 429) and temporary server errors
+RETRY_STATUSES = frozenset((405, 429, 500, 502, 503, 504))
 
 
 class DSEICompanyScraper:
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(self, config: Optional[Config] = None, use_cache: bool = True,
+                 detail_workers: Optional[int] = None, output_file: Optional[str] = None,
+                 keep_in_memory: bool = False, requests_per_second: Optional[float] = None,
+                 burst: Optional[int] = None, transport: Optional[str] = None):
         """
         Initialize the DSEI Company Scraper
         
         Args:
             config: Configuration object. If None, uses default config.
+            use_cache: Use the on-disk HTTP cache if it is enabled in config.
+            detail_workers: Company pages fetched in parallel per list page
+                (1 = sequential). If None, uses config (default 1).
+            output_file: Output CSV file path. If None, uses the path from config.
+            keep_in_memory: Keep every collected company in companies_data (for debugging).
+            requests_per_second: Request rate limit (0 = no limit). If None, uses config,
+                or 1 / delays.between_companies.
+            burst: Maximum burst of requests above the rate. If None, uses config
+                (default detail_workers).
+            transport: HTTP client ('requests' or 'httpx' with HTTP/2). If None, uses config
+                (default 'requests').
         """
         self.config = config or Config()
+        self.sync_config = self.config.get_sync_config()
+        self.detail_workers = max(1, detail_workers or self.sync_config.get('detail_workers', 1))
+        # List pages fetched in parallel when the number of pages is known (max_pages);
+        # 1 (default) keeps fetching them one by one, with the delay between pages
+        self.list_workers = max(1, self.sync_config.get('list_workers', 1))
         
         # URLs from config
         self.base_url = self.config.get_base_url()
         self.list_url_template = self.config.get_list_url_template()
         self.company_detail_url_template = self.config.get_company_detail_url_template()
+        # Templates do not change during a run: bind their format methods once
+        self._format_list_url = self.list_url_template.format
+        self._format_company_url = self.company_detail_url_template.format
         
-        # Set up session with headers
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Get project root for paths
+        self.project_root = Path(__file__).parent.parent.parent
+        
+        # Set up logging
+        self._setup_logging()
+        
+        # HTTP transport: httpx without the package installed falls back to requests
+        self.transport = transport or self.sync_config.get('transport', 'requests')
+        if self.transport not in TRANSPORTS:
+            raise ValueError(f"Unknown HTTP transport: {self.transport}")
+        if self.transport == 'httpx' and httpx is None:
+            self.logger.warning("httpx transport selected, but httpx is not installed: using requests")
+            self.transport = 'requests'
+        
+        headers = {
             'User-Agent': self.config.get_user_agent(),
             'Accept': '*/*',
             'Accept-Language': 'ru,en-US;q=0.7,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate, br, zstd',
+            # Only the encodings urllib3 can decode here (br/zstd need brotli/zstandard)
+            'Accept-Encoding': ACCEPT_ENCODING,
             'X-Requested-With': 'XMLHttpRequest',
             'DNT': '1',
             'Connection': 'keep-alive',
@@ -57,28 +117,70 @@ class DSEICompanyScraper:
             'Sec-Fetch-Site': 'same-origin',
             'Sec-GPC': '1',
             'Priority': 'u=0'
-        })
-        
-        # Get project root for paths
-        self.project_root = Path(__file__).parent.parent.parent
-        
-        # Set up logging
-        self._setup_logging()
-        
-        # Data storage
-        self.companies_data = []
+        }
+        pool_size = max(32, self.detail_workers + self.list_workers)
+        
+        # Only one of the two is set: the requests session or the httpx client
+        self.session: Optional[requests.Session] = None
+        self._client: Optional["httpx.Client"] = None
+        if self.transport == 'httpx':
+            self._client = self._create_httpx_client(headers, pool_size, use_cache)
+        else:
+            # Set up session with headers
+            session = self._create_session(use_cache)
+            session.headers.update(headers)
+            
+            # Keep-alive connection pool reused across the whole run; retries are
+            # handled by make_request_with_retry, not by urllib3
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self.session = session
+        
+        # Data storage: rows are appended to the CSV after every page, only a counter stays in memory
+        self.keep_in_memory = keep_in_memory
+        self.companies_data: List[Company] = []
+        self._pending: List[Company] = []  # Collected since the last flush_csv
+        self._count = 0
         
         # Settings from config
         self.delays = self.config.get_delays()
         self.timeouts = self.config.get_timeouts()
         self.selectors = self.config.get_selectors()
+        # Values needed on every page/company are resolved once
+        self._timeout = self.timeouts.get('request_timeout', 30)
+        self._delay_pages = self.delays.get('between_pages', 2)
+        self._entry_sel = self.selectors.get('company_entry', 'div.m-exhibitor-entry__item')
+        self._title_sel = self.selectors.get('company_title', 'h1.m-exhibitor-entry__item__header__title')
+        self._cat_sel = self.selectors.get('categories', 'li.m-exhibitor-entry__item__header__categories__item')
+        self._desc_sel = self.selectors.get('description', 'div.m-exhibitor-entry__item__body__description')
         self.max_retries = 3
+        # Optional number of companies on a full list page: a shorter page is the last one
+        self.list_page_size = self.sync_config.get('list_page_size')
+        
+        # Request rate limit shared by all worker threads, instead of a fixed sleep
+        # before every company. Without requests_per_second in sync_config the rate
+        # follows the delay between companies
+        if requests_per_second is None:
+            requests_per_second = self.sync_config.get('requests_per_second')
+        if requests_per_second is None and self.delays.get('between_companies', 1):
+            requests_per_second = 1 / self.delays.get('between_companies', 1)
+        if burst is None:
+            burst = self.sync_config.get('burst') or self.detail_workers
+        self.limiter: Optional[TokenBucket] = None
+        if requests_per_second and requests_per_second > 0:
+            self.limiter = TokenBucket(capacity=max(burst, 1), refill_rate=requests_per_second)
         
         # Track existing companies to avoid duplicates
-        self.existing_companies = set()
-        self.output_file_path = None
+        self.existing_companies: Set[str] = set()
+        self.output_file_path = Path(output_file) if output_file else None
         self.last_company_skipped = False  # Track if last company was skipped due to duplicate
-        self.processed_slugs = set()  # Track processed slugs during current session
+        self.processed_slugs: Set[str] = set()  # Track processed slugs during current session
+        
+        # Output CSV kept open for the whole run: each flush appends only the rows added since the last one
+        self._csv_fh: Optional[IO[str]] = None
+        self._csv_writer: Optional["CsvWriter"] = None
+        self._csv_written = 0
     
     def _setup_logging(self):
         """Set up logging configuration"""
@@ -99,8 +201,54 @@ class DSEICompanyScraper:
             ]
         )
         self.logger = logging.getLogger(__name__)
+
+    def _create_session(self, use_cache: bool) -> requests.Session:
+        """
+        Create the HTTP session, backed by the on-disk cache if it is enabled
+
+        Expired cache entries are revalidated with ETag/Last-Modified, so a rerun
+        only downloads pages that changed.
+        """
+        http_cache = self.config.get_http_cache_config()
+        if not use_cache or not http_cache.get('enabled', False):
+            return requests.Session()
+
+        if requests_cache is None:
+            self.logger.warning("HTTP cache is enabled in config, but requests-cache is not installed: cache disabled")
+            return requests.Session()
+
+        # Separate file from the async cache: the two libraries store responses differently
+        cache_path = self.project_root / http_cache.get('sync_path', 'data/raw/http_cache_sync.sqlite')
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger.info(f"HTTP cache enabled: {cache_path}")
+        return requests_cache.CachedSession(
+            str(cache_path),
+            backend='sqlite',
+            expire_after=http_cache.get('expire_after', 86400),
+            allowable_methods=('GET',)
+        )
+
+    def _create_httpx_client(self, headers: Dict[str, str], pool_size: int, use_cache: bool) -> "httpx.Client":
+        """
+        Create an httpx client with HTTP/2: requests to the host share one multiplexed connection
+        
+        The client is thread-safe, so detail workers use it directly.
+        """
+        if use_cache and self.config.get_http_cache_config().get('enabled', False):
+            self.logger.info("HTTP cache is not supported by the httpx transport: cache disabled")
+        
+        # The Connection header is not allowed in HTTP/2
+        headers = {name: value for name, value in headers.items() if name != 'Connection'}
+        
+        # httpx logs every request at INFO level
+        logging.getLogger('httpx').setLevel(logging.WARNING)
+        
+        # The pool is only used if the server negotiates HTTP/1.1
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self.logger.info("HTTP transport: httpx (HTTP/2)")
+        return httpx.Client(http2=True, limits=limits, headers=headers, follow_redirects=True)
     
-    def make_request_with_retry(self, url: str, timeout: int = 30) -> Optional[requests.Response]:
+    def make_request_with_retry(self, url: str, timeout: int = 30) -> Optional[Union[requests.Response, "httpx.Response"]]:
         """
         Make HTTP request with retry logic
         
@@ -109,20 +257,41 @@ class DSEICompanyScraper:
             timeout: Request timeout in seconds
             
         Returns:
-            Response object or None if all retries failed
+            Response object (requests or httpx) or None if all retries failed
         """
         for attempt in range(self.max_retries):
+            if self.limiter is not None:
+                self.limiter.acquire()
+            response: Union[requests.Response, "httpx.Response"]
             try:
-                response = self.session.get(url, timeout=timeout)
-                response.raise_for_status()
-                return response
-                
-            except requests.exceptions.RequestException as e:
+                if self._client is not None:
+                    response = self._client.get(url, timeout=timeout)
+                else:
+                    assert self.session is not None, "HTTP session is not created"
+                    response = self.session.get(url, timeout=timeout)
+            except REQUEST_ERRORS as e:
                 self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
                 if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    time.sleep(backoff_delay(attempt))
                 else:
                     self.logger.error(f"All {self.max_retries} attempts failed for {url}")
+                continue
+            
+            status = response.status_code
+            if 200 <= status < 300:
+                return response
+            
+            # Other client errors (4xx) will not be fixed by a retry
+            self.logger.warning(f"HTTP error {status} for {url} (attempt {attempt + 1}/{self.max_retries})")
+            if status not in RETRY_STATUSES:
+                return None
+            
+            if attempt < self.max_retries - 1:
+                # A Retry-After pause from the server takes priority over the backoff
+                delay = parse_retry_after(response.headers.get('Retry-After'))
+                time.sleep(backoff_delay(attempt) if delay is None else delay)
+            else:
+                self.logger.error(f"All {self.max_retries} attempts failed for {url}")
         
         return None
     
@@ -137,9 +306,8 @@ class DSEICompanyScraper:
             Number of existing companies loaded
         """
         if file_path is None:
-            # Use default output path
-            data_dir = self.project_root / "data" / "processed"
-            file_path = data_dir / self.config.get_output_config().get('csv_filename', 'dsei_companies.csv')
+            # Use the output file given to the constructor, or the default output path
+            file_path = self.output_file_path or self._default_output_path()
         
         # Store the output file path for later use
         self.output_file_path = file_path
@@ -149,16 +317,28 @@ class DSEICompanyScraper:
             return 0
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
+            with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
+                # csv.reader without a dict per row: only the name and slug columns are needed
+                reader = csv.reader(csvfile)
+                header = next(reader, None) or []
+                name_index = header.index('company_name') if 'company_name' in header else None
+                slug_index = header.index('slug_name') if 'slug_name' in header else None
+                slugs_loaded = 0
                 for row in reader:
-                    company_name = row.get('company_name', '').strip()
-                    if company_name:
-                        # Use company name as unique identifier
-                        self.existing_companies.add(company_name.lower())
+                    if name_index is not None and len(row) > name_index:
+                        company_name = row[name_index].strip()
+                        if company_name:
+                            # Use company name as unique identifier
+                            self.existing_companies.add(company_name.lower())
+                    # Known slugs are skipped before their detail page is requested
+                    if slug_index is not None and len(row) > slug_index:
+                        slug = row[slug_index].strip()
+                        if slug:
+                            self.processed_slugs.add(slug)
+                            slugs_loaded += 1
             
             count = len(self.existing_companies)
-            self.logger.info(f"Loaded {count} existing companies from {file_path}")
+            self.logger.info(f"Loaded {count} existing companies ({slugs_loaded} slugs) from {file_path}")
             return count
             
         except Exception as e:
@@ -187,7 +367,7 @@ class DSEICompanyScraper:
         if company_name and company_name.strip():
             self.existing_companies.add(company_name.lower().strip())
     
-    def get_company_slugs_from_page(self, page_number: int) -> List[Dict[str, str]]:
+    def get_company_slugs_from_page(self, page_number: int) -> Tuple[List[Dict[str, str]], bool]:
         """
         STEP 1: Get all company information from a listing page
         
@@ -195,51 +375,43 @@ class DSEICompanyScraper:
             page_number: The page number to scrape
             
         Returns:
-            List of dictionaries containing company slug and stand info
+            List of dictionaries containing company slug and stand info, and
+            whether a next page may follow
         """
-        url = self.list_url_template.format(page=page_number)
+        url = self._format_list_url(page=page_number)
         self.logger.info(f"Fetching page {page_number}: {url}")
         
         try:
-            response = self.make_request_with_retry(url, timeout=self.timeouts.get('request_timeout', 30))
+            response = self.make_request_with_retry(url, timeout=self._timeout)
             if not response:
-                return []
+                return [], False
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = LexborHTMLParser(response.content)
             
             # Find all company blocks using main container
             companies_info = []
             # Find all main company containers first
-            company_containers = soup.find_all('li', class_='m-exhibitors-list__items__item')
+            company_containers = tree.css('li.m-exhibitors-list__items__item')
 
             for container in company_containers:
-                if isinstance(container, Tag):
-                    # Find the link inside this container
-                    link = container.find('a', class_='js-librarylink-entry')
-                    if link and isinstance(link, Tag):
-                        href = link.get('href', '') or ''
-                        # Extract slug from href like "javascript:openRemoteModal('exhibitors-list/wind-river','ajax'..."
-                        if isinstance(href, str):
-                            match = re.search(r"'exhibitors-list/([^']+)'", href)
-                            if match:
-                                slug = match.group(1)
-                                
-                                # Find stand information in the same container
-                                stand = ""
-                                stand_element = container.find('div', class_='m-exhibitors-list__items__item__header__meta__stand')
-                                if stand_element:
-                                    stand_text = stand_element.get_text(strip=True)
-                                    # Extract just the stand number (remove "Stand: " prefix)
-                                    if stand_text.startswith('Stand:'):
-                                        stand = stand_text.replace('Stand:', '').strip()
-                                    else:
-                                        stand = stand_text
-                                
-                                companies_info.append({
-                                    'slug': slug,
-                                    'stand': stand
-                                })
-                                self.logger.debug(f"Found company slug: {slug}, stand: {stand}")
+                # Find the link inside this container
+                link = container.css_first('a.js-librarylink-entry')
+                if link is not None:
+                    href = link.attributes.get('href') or ''
+                    # Extract slug from href like "javascript:openRemoteModal('exhibitors-list/wind-river','ajax'..."
+                    slug = extract_slug(href)
+                    if slug:
+                        # Find stand information in the same container
+                        stand = ""
+                        stand_element = container.css_first('div.m-exhibitors-list__items__item__header__meta__stand')
+                        if stand_element is not None:
+                            stand = clean_stand(stand_element.text(strip=True))
+                        
+                        companies_info.append({
+                            'slug': slug,
+                            'stand': stand
+                        })
+                        self.logger.debug(f"Found company slug: {slug}, stand: {stand}")
 
             # Remove duplicates while preserving order
             unique_companies = []
@@ -253,16 +425,39 @@ class DSEICompanyScraper:
                 self.logger.info(f"Removed {len(companies_info) - len(unique_companies)} duplicate slugs on page {page_number}")
 
             self.logger.info(f"Found {len(unique_companies)} unique companies on page {page_number}")
-            return unique_companies
+            return unique_companies, self._has_next_page(tree, len(unique_companies))
             
-        except requests.exceptions.RequestException as e:
+        except REQUEST_ERRORS as e:
             self.logger.error(f"Error fetching page {page_number}: {e}")
-            return []
+            return [], False
         except Exception as e:
             self.logger.error(f"Unexpected error processing page {page_number}: {e}")
-            return []
+            return [], False
     
-    def get_company_details(self, company_slug: str, page_number: int, stand: str = "") -> Optional[Dict[str, str]]:
+    def _has_next_page(self, tree: LexborHTMLParser, companies_found: int) -> bool:
+        """
+        Decide from the already parsed listing page whether another page follows
+        
+        A rel="next" pagination link settles it. Without one, a page shorter than
+        the configured list_page_size is the last; otherwise the next page is
+        fetched and an empty page ends the run.
+        
+        Args:
+            tree: Parsed listing page
+            companies_found: Number of unique companies on the page
+            
+        Returns:
+            True if there may be more pages, False otherwise
+        """
+        if not companies_found:
+            return False
+        if tree.css_first('a[rel="next"]') is not None:
+            return True
+        if self.list_page_size:
+            return companies_found >= self.list_page_size
+        return True
+    
+    def get_company_details(self, company_slug: str, page_number: int, stand: str = "") -> Optional[Company]:
         """
         STEP 2: Get detailed company information using the company slug
         
@@ -272,138 +467,223 @@ class DSEICompanyScraper:
             stand: Stand information from the listing page
             
         Returns:
-            Dictionary with company details or None if failed
+            Company details or None if failed
         """
-        # Reset skip flag at the start of each company processing
-        self.last_company_skipped = False
+        company_data, self.last_company_skipped = self._fetch_company_details(company_slug, page_number, stand)
+        return company_data
+    
+    def _fetch_company_details(self, company_slug: str, page_number: int, stand: str = "") -> Tuple[Optional[Company], bool]:
+        """
+        Fetch and parse one company page without touching per-company state, so it is safe to run in worker threads
         
-        url = self.company_detail_url_template.format(
-            company_slug=quote(company_slug), 
-            page=page_number
-        )
+        Returns:
+            Company details (None if failed or skipped) and whether the company was skipped as already scraped
+        """
+        # Full company URL: requested once and stored in the url column
+        url = self._format_company_url(company_slug=quote(company_slug), page=page_number)
         
         self.logger.debug(f"Fetching company details: {url}")
         
         try:
-            response = self.make_request_with_retry(url, timeout=self.timeouts.get('request_timeout', 30))
+            response = self.make_request_with_retry(url, timeout=self._timeout)
             if not response:
-                return None
+                return None, False
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = LexborHTMLParser(response.content)
+            # Search only inside the company entry: page navigation and footer are not walked
+            root = tree.css_first(self._entry_sel) or tree
             
             # Extract company name using selector from config
             company_name = ""
-            title_selector = self.selectors.get('company_title', 'h1.m-exhibitor-entry__item__header__title')
-            title_element = soup.select_one(title_selector)
-            if title_element:
-                company_name = title_element.get_text(strip=True)
+            title_element = root.css_first(self._title_sel)
+            if title_element is not None:
+                company_name = title_element.text(strip=True)
             
             # Check if company already exists - skip if it does
             if company_name and self.is_company_already_scraped(company_name):
                 self.logger.info(f"⏭️  Skipping {company_name} - already exists in output file")
-                self.last_company_skipped = True
-                return None
+                return None, True
             
             # Extract tags/categories using selector from config
             tags = []
-            category_selector = self.selectors.get('categories', 'li.m-exhibitor-entry__item__header__categories__item')
-            category_elements = soup.select(category_selector)
+            category_elements = root.css(self._cat_sel)
             for cat_elem in category_elements:
-                tag = cat_elem.get_text(strip=True)
+                tag = cat_elem.text(strip=True)
                 if tag:
                     tags.append(tag)
             
             # Extract overview/description using selector from config
             overview = ""
-            desc_selector = self.selectors.get('description', 'div.m-exhibitor-entry__item__body__description')
-            description_element = soup.select_one(desc_selector)
-            if description_element:
-                overview = description_element.get_text(strip=True)
-            
-            # Extract website URL
-            website = ""
-            website_elements = soup.find_all('a', href=True)
-            for link in website_elements:
-                if isinstance(link, Tag):
-                    href = link.get('href', '') or ''
-                    # Look for external URLs (not internal site links)
-                    if isinstance(href, str) and href.startswith('http') and 'dsei.co.uk' not in href:
-                        website = href
-                        break
-            
-            # Generate full company URL
-            company_url = self.company_detail_url_template.format(
-                company_slug=quote(company_slug), 
-                page=page_number
+            description_element = root.css_first(self._desc_sel)
+            if description_element is not None:
+                overview = description_element.text(strip=True)
+            
+            # Extract website URL (external links, not internal site links)
+            website = find_website(root, description_element)
+            
+            company_data = Company(
+                company_name=company_name,
+                slug_name=company_slug,
+                url=url,
+                stand=stand,
+                tags='; '.join(tags),  # Join tags with semicolon
+                overview=collapse_line_breaks(overview),  # Clean line breaks
+                website=website
             )
             
-            company_data = {
-                'company_name': company_name,
-                'slug_name': company_slug,
-                'url': company_url,
-                'stand': stand,
-                'tags': '; '.join(tags),  # Join tags with semicolon
-                'overview': overview.replace('\n', ' ').replace('\r', ' '),  # Clean line breaks
-                'website': website
-            }
-            
             self.logger.debug(f"Extracted data for {company_name}")
-            return company_data
+            return company_data, False
             
-        except requests.exceptions.RequestException as e:
+        except REQUEST_ERRORS as e:
             self.logger.error(f"Error fetching details for {company_slug}: {e}")
-            return None
+            return None, False
         except Exception as e:
             self.logger.error(f"Unexpected error processing {company_slug}: {e}")
-            return None
+            return None, False
     
-    def has_next_page(self, page_number: int) -> bool:
+    def _fetch_page_details(self, companies_info: List[Dict[str, str]],
+                            page_number: int) -> Iterator[Tuple[Optional[Company], bool]]:
         """
-        Check if there are more pages to process
+        Fetch the company pages of one list page, in list order
+        
+        With detail_workers > 1 the requests run in a thread pool over the shared
+        keep-alive session; the request rate is bounded by the shared limiter.
+        """
+        def fetch(company_info: Dict[str, str]) -> Tuple[Optional[Company], bool]:
+            return self._fetch_company_details(company_info['slug'], page_number, company_info['stand'])
+        
+        if self.detail_workers == 1:
+            yield from map(fetch, companies_info)
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=self.detail_workers)
+        try:
+            yield from executor.map(fetch, companies_info)
+        finally:
+            # On Ctrl+C do not wait for the companies that were not fetched yet
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _iter_list_pages(self, start_page: int,
+                         max_pages: Optional[int]) -> Iterator[Tuple[int, List[Dict[str, str]], bool]]:
+        """
+        Fetch list pages in page order, yielding (page_number, companies_info, has_next)
+        
+        Pages are discovered one by one, with the delay between pages. With
+        list_workers > 1 and a known max_pages every page URL is known up front, so
+        up to list_workers pages are fetched ahead in a thread pool instead; the
+        request rate is bounded by the shared limiter. No new page is requested once
+        a page turns out to be the last one.
+        """
+        if not max_pages or self.list_workers == 1:
+            page_number = start_page
+            while not max_pages or page_number < start_page + max_pages:
+                if page_number != start_page:
+                    time.sleep(self._delay_pages)
+                yield (page_number, *self.get_company_slugs_from_page(page_number))
+                page_number += 1
+            return
+        
+        page_numbers = iter(range(start_page, start_page + max_pages))
+        executor = ThreadPoolExecutor(max_workers=min(self.list_workers, max_pages))
+        pending: Deque[Tuple[int, Future]] = deque()
+        
+        def submit_next():
+            page_number = next(page_numbers, None)
+            if page_number is not None:
+                pending.append((page_number, executor.submit(self.get_company_slugs_from_page, page_number)))
+        
+        try:
+            for _ in range(self.list_workers):
+                submit_next()
+            while pending:
+                page_number, future = pending.popleft()
+                companies_info, has_next = future.result()
+                yield page_number, companies_info, has_next
+                if not (companies_info and has_next):
+                    return
+                submit_next()
+        finally:
+            # The run stopped early (last page or Ctrl+C): drop pages not fetched yet
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    @property
+    def companies_count(self) -> int:
+        """Number of companies collected in this run"""
+        return self._count
+    
+    def _default_output_path(self) -> Path:
+        """Output CSV path from config, inside data/processed"""
+        return self.project_root / "data" / "processed" / self.config.get_output_config().get('csv_filename', 'dsei_companies.csv')
+    
+    def _open_csv(self):
+        """Open the output CSV for appending, writing the header if the file is new/empty"""
+        file_path = self.output_file_path or self._default_output_path()
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_exists = file_path.exists() and file_path.stat().st_size > 0
+        
+        self._csv_fh = open(file_path, 'a' if file_exists else 'w', newline='', encoding='utf-8', buffering=1 << 20)
+        self._csv_writer = csv.writer(self._csv_fh)
+        if not file_exists:
+            self._csv_writer.writerow(CSV_FIELDNAMES)
+    
+    def flush_csv(self) -> int:
+        """
+        Append companies collected since the last flush to the output CSV
         
-        Args:
-            page_number: Current page number
-            
         Returns:
-            True if there are more pages, False otherwise
+            Number of companies written
         """
-        url = self.list_url_template.format(page=page_number + 1)
+        new_companies = self._pending
+        if not new_companies:
+            return 0
         
         try:
-            response = self.make_request_with_retry(url, timeout=self.timeouts.get('request_timeout', 30))
-            if not response:
-                return False
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Check if there are any company links on the next page
-            company_links = soup.find_all('a', class_='js-librarylink-entry')
-            
-            return len(company_links) > 0
-            
-        except requests.exceptions.RequestException:
-            return False
-        except Exception:
-            return False
+            if self._csv_fh is None:
+                self._open_csv()
+            csv_fh, csv_writer = self._csv_fh, self._csv_writer
+            assert csv_fh is not None and csv_writer is not None
+            csv_writer.writerows(new_companies)
+            csv_fh.flush()
+        except Exception as e:
+            self.logger.error(f"Error saving to CSV: {e}")
+            return 0
+        
+        self._pending = []
+        self._csv_written += len(new_companies)
+        return len(new_companies)
+    
+    def close_csv(self):
+        """Flush the remaining companies and close the output CSV"""
+        self.flush_csv()
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._csv_writer = None
     
     def save_to_csv(self, filename: Optional[str] = None):
         """
         Save collected data to CSV file
         
+        Without a filename, only companies not yet flushed to the output CSV are
+        appended. A filename exports every company kept in memory (keep_in_memory=True).
+        
         Args:
-            filename: Output CSV filename. If None, uses config default.
+            filename: Output CSV filename. If None, uses the output file.
         """
+        if filename is None:
+            if not self._count:
+                self.logger.warning("No data to save")
+                return
+            self.close_csv()
+            file_path = self.output_file_path or self._default_output_path()
+            self.logger.info(f"Saved {self._csv_written} companies to {file_path}")
+            return
+        
         if not self.companies_data:
             self.logger.warning("No data to save")
             return
         
-        if filename is None:
-            # Save to data/processed directory
-            data_dir = self.project_root / "data" / "processed"
-            data_dir.mkdir(parents=True, exist_ok=True)
-            file_path = data_dir / self.config.get_output_config().get('csv_filename', 'dsei_companies.csv')
-        else:
-            file_path = Path(filename)
+        file_path = Path(filename)
         
         try:
             # Check if file exists to determine if we need to write header
@@ -412,16 +692,15 @@ class DSEICompanyScraper:
             # Open in append mode if file exists, write mode if new
             mode = 'a' if file_exists else 'w'
             
-            with open(file_path, mode, newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['company_name', 'slug_name', 'url', 'stand', 'tags', 'overview', 'website']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            # Companies are already CSV rows: one writerows call through a 1 MiB buffer
+            with open(file_path, mode, newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
                 
                 # Only write header if file is new/empty
                 if not file_exists:
-                    writer.writeheader()
+                    writer.writerow(CSV_FIELDNAMES)
                 
-                for company in self.companies_data:
-                    writer.writerow(company)
+                writer.writerows(self.companies_data)
             
             action = "Appended" if file_exists else "Saved"
             self.logger.info(f"{action} {len(self.companies_data)} companies to {file_path}")
@@ -442,66 +721,67 @@ class DSEICompanyScraper:
         # Load existing companies to avoid duplicates
         self.load_existing_companies()
         
-        current_page = start_page
         pages_scraped = 0
         
-        while True:
-            # Check max pages limit
-            if max_pages and pages_scraped >= max_pages:
-                self.logger.info(f"Reached maximum pages limit: {max_pages}")
-                break
-            
-            # STEP 1: Get company slugs from current page
-            companies_info = self.get_company_slugs_from_page(current_page)
-            
+        # STEP 1: Get company slugs from each page
+        for current_page, companies_info, has_next in self._iter_list_pages(start_page, max_pages):
             # Check if page has companies (flowchart decision point)
             if not companies_info:
                 self.logger.info(f"No companies found on page {current_page}. Parsing completed.")
                 break
             
             # STEP 2: Process each company
+            new_companies = []
             for company_info in companies_info:
                 slug = company_info['slug']
-                stand = company_info['stand']
                 
                 # Skip if this slug was already processed in current session
                 if slug in self.processed_slugs:
                     self.logger.info(f"⏭️  Skipping slug '{slug}' - already processed in current session")
                     continue
                 
-                # Add delay to be respectful to the server
-                time.sleep(self.delays.get('between_companies', 1))
-                
                 # Mark slug as processed
                 self.processed_slugs.add(slug)
+                new_companies.append(company_info)
+            
+            page_details = self._fetch_page_details(new_companies, current_page)
+            for company_info, (company_details, skipped) in zip(new_companies, page_details):
+                slug = company_info['slug']
+                
+                # Parallel workers can fetch two pages of the same company before either is recorded
+                if company_details and self.is_company_already_scraped(company_details.company_name):
+                    self.logger.info(f"⏭️  Skipping {company_details.company_name} - already exists in output file")
+                    continue
                 
-                company_details = self.get_company_details(slug, current_page, stand)
                 if company_details:
-                    self.companies_data.append(company_details)
+                    self._pending.append(company_details)
+                    self._count += 1
+                    if self.keep_in_memory:
+                        self.companies_data.append(company_details)
                     # Add to existing companies set to prevent re-scraping
-                    self.add_company_to_existing(company_details['company_name'])
-                    self.logger.info(f"Processed: {company_details['company_name']}")
+                    self.add_company_to_existing(company_details.company_name)
+                    self.logger.info(f"Processed: {company_details.company_name}")
                 else:
                     # Only log warning if the company wasn't skipped due to duplicate
-                    if not self.last_company_skipped:
+                    if not skipped:
                         self.logger.warning(f"Failed to get details for slug: {slug}")
                     # If it was skipped, we already logged the skip message, so no additional message needed
             
+            pages_scraped += 1
+            
+            # Auto-save: append this page's companies to the output CSV
+            self.flush_csv()
+            
             # Check if there's a next page (flowchart decision point)
-            if not self.has_next_page(current_page):
+            if not has_next:
                 self.logger.info("No more pages found. Parsing completed.")
                 break
-            
-            # Move to next page
-            current_page += 1
-            pages_scraped += 1
-            
-            # Add delay between pages
-            time.sleep(self.delays.get('between_pages', 2))
+        else:
+            self.logger.info(f"Reached maximum pages limit: {max_pages}")
         
         # Final report
-        self.logger.info(f"Scraping completed. Total companies collected: {len(self.companies_data)}")
-        self.logger.info(f"Pages processed: {pages_scraped + 1}")
+        self.logger.info(f"Scraping completed. Total companies collected: {self._count}")
+        self.logger.info(f"Pages processed: {pages_scraped}")
         
         # Save data to CSV
         self.save_to_csv()
@@ -0,0 +1,106 @@
+"""
+Retry timing and request rate limiting shared by the sync and async scrapers
+"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Exponential retry delay: base, cap (seconds) and jitter so concurrent workers do not retry in lockstep
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+BACKOFF_JITTER = (0.8, 1.2)
+# Upper bound for a Retry-After pause (seconds)
+RETRY_AFTER_MAX = 300.0
+
+
+def backoff_delay(attempt: int) -> float:
+    """Delay before a retry: BACKOFF_BASE * 2**attempt with random jitter, at most BACKOFF_MAX"""
+    return min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt * random.uniform(*BACKOFF_JITTER))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header in seconds (delta seconds or HTTP date); None if missing or malformed"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    if math.isnan(seconds):
+        return None
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX)
+
+
+class _TokenBucketBase:
+    """
+    Token bucket arithmetic shared by the thread and asyncio rate limiters
+    
+    Allows a burst of up to capacity requests, then no more than refill_rate
+    requests per second. Subclasses only add locking and sleeping.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Args:
+            capacity: Bucket size - maximum burst of requests
+            refill_rate: Refill rate (requests per second)
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+    
+    def _take(self) -> float:
+        """
+        Take one token if there is one
+        
+        Returns:
+            0 if a token was taken, otherwise seconds until the next token is earned
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.refill_rate
+
+
+class TokenBucket(_TokenBucketBase):
+    """Thread-safe request rate limiter: waiting threads are served in turn"""
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        super().__init__(capacity, refill_rate)
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        with self._lock:
+            wait = self._take()
+            while wait:
+                time.sleep(wait)
+                wait = self._take()
+
+
+class AsyncTokenBucket(_TokenBucketBase):
+    """asyncio request rate limiter: waiting tasks are served in turn"""
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        super().__init__(capacity, refill_rate)
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Take one token, waiting until one is available"""
+        async with self._lock:
+            wait = self._take()
+            while wait:
+                await asyncio.sleep(wait)
+                wait = self._take()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the async scraper helpers (no network access)
+"""
+
+import asyncio
+import csv
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from dsei_scraper import async_scraper
+from dsei_scraper.async_scraper import AsyncDSEICompanyScraper
+from dsei_scraper.models import CSV_FIELDNAMES, Company
+
+# Flush deadline used instead of CSV_FLUSH_INTERVAL so the writer tests run quickly
+FLUSH_INTERVAL = 0.3
+
+
+def make_company(slug: str) -> Company:
+    return Company(slug.title(), slug, f"https://www.dsei.co.uk/exhibitors-list/{slug}", "S1", "", "", "")
+
+
+def read_rows(file_path: Path):
+    if not file_path.exists():
+        return []
+    with open(file_path, encoding='utf-8', newline='') as csvfile:
+        return list(csv.reader(csvfile))
+
+
+def run_writer(file_path: Path, scenario):
+    """Run _csv_writer_loop with a short flush deadline while scenario(queue) feeds it rows"""
+    async def run():
+        writer_owner = SimpleNamespace(_out_queue=asyncio.Queue(), logger=logging.getLogger(__name__))
+        writer_task = asyncio.create_task(AsyncDSEICompanyScraper._csv_writer_loop(writer_owner, file_path))
+        try:
+            return await scenario(writer_owner._out_queue)
+        finally:
+            await writer_owner._out_queue.put(None)
+            await writer_task
+
+    original_interval = async_scraper.CSV_FLUSH_INTERVAL
+    async_scraper.CSV_FLUSH_INTERVAL = FLUSH_INTERVAL
+    try:
+        return asyncio.run(run())
+    finally:
+        async_scraper.CSV_FLUSH_INTERVAL = original_interval
+
+
+def test_csv_writer_flushes_after_deadline():
+    """A batch smaller than CSV_STREAM_BATCH_SIZE is written once the flush deadline passes"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "companies.csv"
+
+        async def scenario(out_queue):
+            await out_queue.put(make_company("alpha"))
+            await asyncio.sleep(FLUSH_INTERVAL / 2)
+            before_deadline = read_rows(file_path)
+            await asyncio.sleep(FLUSH_INTERVAL)
+            return before_deadline, read_rows(file_path)
+
+        before_deadline, after_deadline = run_writer(file_path, scenario)
+        assert before_deadline == []
+        assert after_deadline == [CSV_FIELDNAMES, list(make_company("alpha"))]
+
+
+def test_csv_writer_deadline_counts_from_first_row():
+    """Rows arriving more often than the deadline do not postpone the flush"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "companies.csv"
+
+        async def scenario(out_queue):
+            start = time.monotonic()
+            index = 0
+            while time.monotonic() - start < FLUSH_INTERVAL * 2:
+                await out_queue.put(make_company(f"company-{index}"))
+                index += 1
+                await asyncio.sleep(FLUSH_INTERVAL / 6)
+            return read_rows(file_path), index
+
+        rows, sent = run_writer(file_path, scenario)
+        # Written while rows were still arriving, before the final None
+        assert len(rows) > 1 and rows[0] == CSV_FIELDNAMES
+        # Everything sent is in the file after the final flush, each row once
+        rows = read_rows(file_path)
+        slugs = [row[1] for row in rows[1:]]
+        assert slugs == [f"company-{index}" for index in range(sent)]
+
+
+def test_csv_writer_writes_every_row_once():
+    """A new file gets the header and every queued row, in order, once the writer finishes"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "companies.csv"
+        companies = [make_company(f"company-{index}") for index in range(5)]
+
+        async def scenario(out_queue):
+            for company in companies:
+                await out_queue.put(company)
+
+        run_writer(file_path, scenario)
+        assert read_rows(file_path) == [CSV_FIELDNAMES] + [list(company) for company in companies]
+
+
+def test_csv_writer_appends_to_existing_file():
+    """Rows are appended under the existing header, which is not written again"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "companies.csv"
+        with open(file_path, 'w', encoding='utf-8', newline='') as csvfile:
+            csv.writer(csvfile).writerows([CSV_FIELDNAMES, list(make_company("alpha"))])
+
+        async def scenario(out_queue):
+            await out_queue.put(make_company("beta"))
+
+        run_writer(file_path, scenario)
+        assert read_rows(file_path) == [CSV_FIELDNAMES, list(make_company("alpha")), list(make_company("beta"))]
+
+
+def test_csv_writer_retries_failed_batch():
+    """A batch whose write fails part-way is kept and rewritten once, without duplicate rows"""
+    real_append = async_scraper._append_rows_sync
+    calls = []
+
+    def failing_append(csvfile, writer, companies, write_header):
+        calls.append(len(companies))
+        if len(calls) == 1:
+            # Part of the batch reaches the file before the error
+            real_append(csvfile, writer, companies[:1], write_header)
+            raise OSError("disk full")
+        return real_append(csvfile, writer, companies, write_header)
+
+    async_scraper._append_rows_sync = failing_append
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "companies.csv"
+            companies = [make_company(f"company-{index}") for index in range(3)]
+
+            async def scenario(out_queue):
+                for company in companies[:2]:
+                    await out_queue.put(company)
+                # The flush deadline triggers the failing write
+                await asyncio.sleep(FLUSH_INTERVAL * 1.5)
+                await out_queue.put(companies[2])
+
+            run_writer(file_path, scenario)
+            assert calls[0] == 2
+            assert read_rows(file_path) == [CSV_FIELDNAMES] + [list(company) for company in companies]
+    finally:
+        async_scraper._append_rows_sync = real_append
+
+
+if __name__ == "__main__":
+    test_csv_writer_writes_every_row_once()
+    test_csv_writer_flushes_after_deadline()
+    test_csv_writer_deadline_counts_from_first_row()
+    test_csv_writer_appends_to_existing_file()
+    test_csv_writer_retries_failed_batch()
+    print("All async scraper tests passed")
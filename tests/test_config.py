@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the configuration handler (no network access)
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from dsei_scraper.config import Config, _flatten
+
+
+def test_flatten_yields_sections_and_leaves():
+    """Every value is yielded under its dotted key, nested sections as well as their leaves"""
+    nested = {
+        "base_url": "https://example.com",
+        "delays": {"between_pages": 1, "between_companies": 0.1},
+        "a": {"b": {"c": None}},
+        "empty": {},
+    }
+    assert dict(_flatten(nested)) == {
+        "base_url": "https://example.com",
+        "delays": {"between_pages": 1, "between_companies": 0.1},
+        "delays.between_pages": 1,
+        "delays.between_companies": 0.1,
+        "a": {"b": {"c": None}},
+        "a.b": {"c": None},
+        "a.b.c": None,
+        "empty": {},
+    }
+
+
+def test_flatten_prefix_and_empty_dict():
+    """The prefix is prepended to every key; an empty dict yields nothing"""
+    assert list(_flatten({})) == []
+    assert list(_flatten({"x": {"y": 2}}, "root.")) == [("root.x", {"y": 2}), ("root.x.y", 2)]
+
+
+def test_config_get_uses_dotted_keys():
+    """Config.get finds nested values by dotted key and falls back to the default"""
+    settings = {"async_config": {"transport": "httpx", "burst": 0}, "output": {"csv_filename": "out.csv"}}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = Path(tmp_dir) / "config.json"
+        config_path.write_text(json.dumps(settings), encoding="utf-8")
+        config = Config(str(config_path))
+
+    assert config.get("async_config.transport") == "httpx"
+    # Falsy values are returned, not replaced by the default
+    assert config.get("async_config.burst", 15) == 0
+    assert config.get("async_config") == {"transport": "httpx", "burst": 0}
+    assert config.get("output.csv_filename") == "out.csv"
+    assert config.get("async_config.missing", "default") == "default"
+    assert config.get("missing.section") is None
+
+
+def test_default_config_has_sync_and_async_sections():
+    """Without a config file the built-in defaults provide both scraper sections"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = Config(str(Path(tmp_dir) / "missing.json"))
+
+    assert config.get_async_config()["max_concurrent_tasks"] == 15
+    assert "list_page_size" in config.get_sync_config()
+    assert config.get("sync_config.list_page_size") is None
+
+
+if __name__ == "__main__":
+    test_flatten_yields_sections_and_leaves()
+    test_flatten_prefix_and_empty_dict()
+    test_config_get_uses_dotted_keys()
+    test_default_config_has_sync_and_async_sections()
+    print("All config tests passed")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the page parsing helpers shared by both scrapers (no network access)
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from selectolax.lexbor import LexborHTMLParser
+
+from dsei_scraper.parsing import clean_stand, collapse_line_breaks, extract_slug, find_website, is_external_url
+
+
+def test_extract_slug():
+    """The slug is the text between 'exhibitors-list/ and the next quote"""
+    href = "javascript:openRemoteModal('exhibitors-list/wind-river','ajax',{},'')"
+    assert extract_slug(href) == "wind-river"
+    assert extract_slug("javascript:openRemoteModal('exhibitors-list/a-b.c_d','ajax')") == "a-b.c_d"
+
+
+def test_extract_slug_without_slug():
+    """Links without the marker, an empty slug or a closing quote give None"""
+    for href in (
+        "",
+        "https://www.dsei.co.uk/exhibitors-list/wind-river",
+        "javascript:openRemoteModal('other-list/wind-river','ajax')",
+        "javascript:openRemoteModal('exhibitors-list/','ajax')",
+        "javascript:openRemoteModal('exhibitors-list/wind-river",
+    ):
+        assert extract_slug(href) is None, href
+
+
+def test_clean_stand():
+    """Only a leading "Stand:" prefix is removed"""
+    assert clean_stand("Stand: S1-210") == "S1-210"
+    assert clean_stand("Stand:N4") == "N4"
+    assert clean_stand("N4") == "N4"
+    assert clean_stand("") == ""
+
+
+def test_collapse_line_breaks():
+    """Each run of CR/LF, wherever it is, becomes a single space"""
+    assert collapse_line_breaks("a\nb\rc\r\nd") == "a b c d"
+    assert collapse_line_breaks("one\n\r\n\rtwo") == "one two"
+    assert collapse_line_breaks("\r\nboth ends\n") == " both ends "
+    assert collapse_line_breaks("\n\r") == " "
+
+
+def test_collapse_line_breaks_without_breaks():
+    """Text without line breaks is returned as is"""
+    text = "no line breaks here"
+    assert collapse_line_breaks(text) is text
+    assert collapse_line_breaks("") == ""
+
+
+def test_is_external_url():
+    """Only absolute links to hosts outside dsei.co.uk and its subdomains are external"""
+    assert is_external_url("https://windriver.com/products")
+    assert is_external_url("http://notdsei.co.uk")
+    assert not is_external_url("https://www.dsei.co.uk/exhibitors-list/wind-river")
+    assert not is_external_url("https://dsei.co.uk")
+    assert not is_external_url("/exhibitors-list/wind-river")
+    assert not is_external_url("")
+
+
+def test_is_external_url_malformed():
+    """A URL that urlsplit rejects is not external"""
+    assert not is_external_url("http://[abc/")
+
+
+def test_find_website_prefers_description():
+    """A link in the description wins over an earlier one elsewhere on the page"""
+    tree = LexborHTMLParser(
+        "<body><a href='https://partner.example.com'>partner</a>"
+        "<a href='https://www.dsei.co.uk/home'>home</a>"
+        "<div class='description'>Text <a href='https://company.example.com'>site</a></div></body>"
+    )
+    description = tree.css_first("div.description")
+    assert find_website(tree, description) == "https://company.example.com"
+
+
+def test_find_website_falls_back_to_page():
+    """Without an external link in the description, the first one on the page is used"""
+    tree = LexborHTMLParser(
+        "<body><a href='http://[abc/'>broken</a><a href='https://www.dsei.co.uk/home'>home</a>"
+        "<a href='https://company.example.com'>site</a>"
+        "<div class='description'>No links</div></body>"
+    )
+    assert find_website(tree, tree.css_first("div.description")) == "https://company.example.com"
+    assert find_website(tree, None) == "https://company.example.com"
+    assert find_website(LexborHTMLParser("<p>none</p>"), None) == ""
+
+
+if __name__ == "__main__":
+    test_extract_slug()
+    test_extract_slug_without_slug()
+    test_clean_stand()
+    test_collapse_line_breaks()
+    test_collapse_line_breaks_without_breaks()
+    test_is_external_url()
+    test_is_external_url_malformed()
+    test_find_website_prefers_description()
+    test_find_website_falls_back_to_page()
+    print("All parsing tests passed")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Unit tests for resuming an interrupted run from the output CSV (no network access)
+"""
+
+import asyncio
+import csv
+import logging
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from dsei_scraper.async_scraper import AsyncDSEICompanyScraper, _read_existing_sync
+from dsei_scraper.models import CSV_FIELDNAMES
+from dsei_scraper.scraper import DSEICompanyScraper
+
+ROWS = [
+    ["Wind River", "wind-river", "https://www.dsei.co.uk/exhibitors-list/wind-river", "S1", "", "", ""],
+    ["  ACME Ltd ", " acme ", "https://www.dsei.co.uk/exhibitors-list/acme", "S2", "", "", ""],
+    # A row cut short by an interrupted write: the name is kept, there is no slug
+    ["Partial Co"],
+    ["", "", "", "", "", "", ""],
+]
+
+
+def write_csv(file_path: Path, header, rows):
+    with open(file_path, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def make_state():
+    """Attributes load_existing_companies uses, without building a scraper (no session, no log files)"""
+    return SimpleNamespace(output_file_path=None, existing_companies=set(), processed_slugs=set(),
+                           logger=logging.getLogger(__name__))
+
+
+def test_read_existing_names_and_slugs():
+    """Names are lower-cased and stripped, slugs stripped; empty values are skipped"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "companies.csv"
+        write_csv(file_path, CSV_FIELDNAMES, ROWS)
+        names, slugs = _read_existing_sync(file_path)
+
+    assert names == {"wind river", "acme ltd", "partial co"}
+    assert slugs == {"wind-river", "acme"}
+
+
+def test_read_existing_without_slug_column():
+    """An older CSV without slug_name still gives the names and no slugs"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "companies.csv"
+        write_csv(file_path, ["company_name", "url"], [["Wind River", "https://example.com"]])
+        assert _read_existing_sync(file_path) == ({"wind river"}, set())
+
+        file_path.write_text("", encoding='utf-8')
+        assert _read_existing_sync(file_path) == (set(), set())
+
+
+def test_async_load_existing_marks_slugs_processed():
+    """Slugs in the output file are marked processed, so their pages are not requested again"""
+    state = make_state()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "companies.csv"
+        write_csv(file_path, CSV_FIELDNAMES, ROWS)
+        count = asyncio.run(AsyncDSEICompanyScraper.load_existing_companies(state, file_path))
+
+    assert count == 3
+    assert state.output_file_path == file_path
+    assert state.processed_slugs == {"wind-river", "acme"}
+
+
+def test_sync_load_existing_marks_slugs_processed():
+    """The sync scraper resumes from the same slugs as the async one"""
+    state = make_state()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "companies.csv"
+        write_csv(file_path, CSV_FIELDNAMES, ROWS)
+        count = DSEICompanyScraper.load_existing_companies(state, file_path)
+
+    assert count == 3
+    assert state.output_file_path == file_path
+    assert state.existing_companies == {"wind river", "acme ltd", "partial co"}
+    assert state.processed_slugs == {"wind-river", "acme"}
+
+
+def test_load_existing_missing_file_starts_fresh():
+    """Without an output file nothing is loaded and the path is kept for writing"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "missing.csv"
+        async_state = make_state()
+        assert asyncio.run(AsyncDSEICompanyScraper.load_existing_companies(async_state, file_path)) == 0
+        sync_state = make_state()
+        assert DSEICompanyScraper.load_existing_companies(sync_state, file_path) == 0
+
+    for state in (async_state, sync_state):
+        assert state.output_file_path == file_path
+        assert not state.existing_companies and not state.processed_slugs
+
+
+if __name__ == "__main__":
+    test_read_existing_names_and_slugs()
+    test_read_existing_without_slug_column()
+    test_async_load_existing_marks_slugs_processed()
+    test_sync_load_existing_marks_slugs_processed()
+    test_load_existing_missing_file_starts_fresh()
+    print("All resume tests passed")
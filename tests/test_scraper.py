@@ -23,7 +23,7 @@ def test_scraper():
     
     # Create config and scraper instance
     config = Config()
-    scraper = DSEICompanyScraper(config)
+    scraper = DSEICompanyScraper(config, keep_in_memory=True)
     
     # Test with just 1 page to start
     print("Testing with 1 page...")
@@ -36,7 +36,7 @@ def test_scraper():
     if scraper.companies_data:
         print("\nFirst company example:")
         first_company = scraper.companies_data[0]
-        for key, value in first_company.items():
+        for key, value in first_company._asdict().items():
             print(f"  {key}: {value[:100]}{'...' if len(str(value)) > 100 else ''}")
     
     print(f"\nCheck 'dsei_companies.csv' for full results")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the retry timing and rate limiting helpers (no network access)
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from dsei_scraper.throttling import (BACKOFF_BASE, BACKOFF_JITTER, BACKOFF_MAX, RETRY_AFTER_MAX,
+                                     AsyncTokenBucket, TokenBucket, backoff_delay, parse_retry_after)
+
+# Rate used by the bucket tests: high enough to keep them fast, low enough to measure
+RATE = 50.0
+
+
+def test_token_bucket_allows_burst():
+    """A full bucket lets capacity requests through without waiting"""
+    bucket = TokenBucket(capacity=5, refill_rate=RATE)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - start < 1 / RATE
+
+
+def test_token_bucket_limits_rate():
+    """After the burst, requests are spaced by 1 / refill_rate"""
+    bucket = TokenBucket(capacity=1, refill_rate=RATE)
+    bucket.acquire()
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+    assert 5 / RATE * 0.9 <= elapsed < 5 / RATE + 0.5, elapsed
+
+
+def test_token_bucket_shared_by_threads():
+    """Threads sharing one bucket together stay within the rate"""
+    bucket = TokenBucket(capacity=2, refill_rate=RATE)
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(12)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 2 tokens are available at once, the other 10 are earned at RATE per second
+    assert time.monotonic() - start >= 10 / RATE * 0.9
+
+
+def test_token_bucket_refills_up_to_capacity():
+    """Idle time refills the bucket, but never above capacity"""
+    bucket = TokenBucket(capacity=2, refill_rate=RATE)
+    bucket.acquire()
+    bucket.acquire()
+    time.sleep(10 / RATE)
+    start = time.monotonic()
+    bucket.acquire()
+    bucket.acquire()
+    assert time.monotonic() - start < 1 / RATE
+    bucket.acquire()
+    assert time.monotonic() - start >= 1 / RATE * 0.9
+
+
+def test_async_token_bucket_limits_rate():
+    """Concurrent tasks sharing one asyncio bucket get the burst, then the rate"""
+    async def run() -> float:
+        bucket = AsyncTokenBucket(capacity=2, refill_rate=RATE)
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(7)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    assert 5 / RATE * 0.9 <= elapsed < 5 / RATE + 0.5, elapsed
+
+
+def test_backoff_delay_doubles_within_jitter():
+    """Each attempt doubles the base delay, scaled by a random factor within BACKOFF_JITTER"""
+    low, high = BACKOFF_JITTER
+    for attempt in range(4):
+        delay = BACKOFF_BASE * 2 ** attempt
+        samples = [backoff_delay(attempt) for _ in range(200)]
+        assert all(delay * low <= sample <= delay * high for sample in samples), attempt
+        # Jitter: concurrent workers do not all retry after the same delay
+        assert len(set(samples)) > 1
+
+
+def test_backoff_delay_is_capped():
+    """Late attempts never wait longer than BACKOFF_MAX"""
+    for attempt in range(5, 30):
+        assert backoff_delay(attempt) <= BACKOFF_MAX
+    assert backoff_delay(20) == BACKOFF_MAX
+
+
+def test_parse_retry_after_seconds():
+    """Delta seconds are returned as is, negative values as 0 and large ones capped"""
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("0") == 0.0
+    assert parse_retry_after("-5") == 0.0
+    assert parse_retry_after(str(RETRY_AFTER_MAX * 10)) == RETRY_AFTER_MAX
+    assert parse_retry_after("inf") == RETRY_AFTER_MAX
+
+
+def test_parse_retry_after_http_date():
+    """An HTTP date gives the seconds left until it, 0 if it is in the past"""
+    future = datetime.now(timezone.utc) + timedelta(seconds=60)
+    seconds = parse_retry_after(format_datetime(future, usegmt=True))
+    # The header has whole seconds only
+    assert seconds is not None and 58 <= seconds <= 60, seconds
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    far_future = datetime.now(timezone.utc) + timedelta(days=1)
+    assert parse_retry_after(format_datetime(far_future, usegmt=True)) == RETRY_AFTER_MAX
+
+
+def test_parse_retry_after_missing_or_malformed():
+    """Missing and unparsable values give None, so the caller falls back to backoff_delay"""
+    for value in (None, "", "soon", "12 seconds", "nan", "Wed, 99 Foo 2015"):
+        assert parse_retry_after(value) is None, repr(value)
+
+
+if __name__ == "__main__":
+    test_token_bucket_allows_burst()
+    test_token_bucket_limits_rate()
+    test_token_bucket_shared_by_threads()
+    test_token_bucket_refills_up_to_capacity()
+    test_async_token_bucket_limits_rate()
+    test_backoff_delay_doubles_within_jitter()
+    test_backoff_delay_is_capped()
+    test_parse_retry_after_seconds()
+    test_parse_retry_after_http_date()
+    test_parse_retry_after_missing_or_malformed()
+    print("All throttling tests passed")